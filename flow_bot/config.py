@@ -7,8 +7,9 @@ from __future__ import annotations
 
 import json
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 try:
     import yaml
@@ -18,6 +19,14 @@ except Exception:  # pragma: no cover - optional dependency
 
 DEFAULT_CONFIG_PATH = Path("config.yaml")
 
+# Per-mode fallbacks used when neither the mode section nor ticker overrides
+# set a threshold.
+_MODE_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "scalp": {"max_dte": 0, "time_horizon_min": 5, "time_horizon_max": 30},
+    "day_trade": {"max_dte": 10, "time_horizon_min": 30, "time_horizon_max": 180},
+    "swing": {"max_dte": 10**6},
+}
+
 
 def load_api_keys() -> Dict[str, str]:
     """Load provider API keys from environment variables in one place.
@@ -117,3 +126,71 @@ def get_ticker_config(global_cfg: Dict[str, Any], ticker: str, mode: str) -> Dic
     mode_override = ticker_override.get(mode, {}) if isinstance(ticker_override, dict) else {}
     merged.update(mode_override)
     return merged
+
+
+@dataclass(frozen=True, slots=True)
+class ModeCfg:
+    """Resolved thresholds for one (ticker, mode) pair.
+
+    Built once from the merged dict returned by :func:`get_ticker_config` so
+    strategies read plain attributes instead of ``dict.get`` with defaults on
+    every event.
+
+    Attributes:
+        min_notional: Notional gate applied before scoring (default 0).
+        score_min_notional: Notional threshold used by scoring; falls back to
+            ``min_premium`` when ``min_notional`` is unset.
+        time_horizon_days_max: Swing holding horizon; ``None`` means "use the
+            contract DTE".
+    """
+
+    min_notional: float = 0
+    score_min_notional: float = 0
+    min_dte: int = 0
+    max_dte: int = 10**6
+    max_otm_pct: float = 100
+    min_rvol: float = 0
+    min_strength: float = 0
+    tp_pct: Optional[float] = None
+    sl_pct: Optional[float] = None
+    time_horizon_min: int = 0
+    time_horizon_max: int = 0
+    time_horizon_days_min: int = 2
+    time_horizon_days_max: Optional[int] = None
+
+
+def get_ticker_mode_cfg(global_cfg: Dict[str, Any], ticker: str, mode: str) -> ModeCfg:
+    """Resolve :func:`get_ticker_config` for ``ticker``/``mode`` into a :class:`ModeCfg`."""
+
+    return mode_cfg_from_dict(get_ticker_config(global_cfg, ticker, mode), mode)
+
+
+def mode_cfg_from_dict(merged: Dict[str, Any], mode: str = "") -> ModeCfg:
+    """Build a :class:`ModeCfg` from a plain mode-config dict.
+
+    ``mode`` selects the per-mode fallbacks for keys the dict leaves unset.
+    """
+
+    defaults = _MODE_DEFAULTS.get(mode, {})
+
+    score_min_notional = merged.get("min_notional")
+    if score_min_notional is None:
+        score_min_notional = merged.get("min_premium", 0)
+
+    days_max = merged.get("time_horizon_days_max", merged.get("max_dte"))
+
+    return ModeCfg(
+        min_notional=merged.get("min_notional", 0),
+        score_min_notional=score_min_notional,
+        min_dte=merged.get("min_dte", 0),
+        max_dte=merged.get("max_dte", defaults.get("max_dte", 10**6)),
+        max_otm_pct=merged.get("max_otm_pct", 100),
+        min_rvol=merged.get("min_rvol", 0),
+        min_strength=merged.get("min_strength", 0),
+        tp_pct=merged.get("tp_pct"),
+        sl_pct=merged.get("sl_pct"),
+        time_horizon_min=int(merged.get("time_horizon_min", defaults.get("time_horizon_min", 0))),
+        time_horizon_max=int(merged.get("time_horizon_max", defaults.get("time_horizon_max", 0))),
+        time_horizon_days_min=int(merged.get("time_horizon_days_min", merged.get("min_dte", 2))),
+        time_horizon_days_max=int(days_max) if days_max is not None else None,
+    )
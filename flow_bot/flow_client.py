@@ -1,12 +1,26 @@
 """Abstraction layer for flow data providers (Polygon, Massive, etc.)."""
 from __future__ import annotations
 
+import functools
 import logging
+import random
+import sys
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, Iterator, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
 
 from .config import load_api_keys
 from .universe import resolve_universe
@@ -15,21 +29,194 @@ from .models import FlowEvent
 LOGGER = logging.getLogger(__name__)
 
 
+# Candidate provider keys per FlowEvent field, in priority order.
+_TICKER_KEYS = ("ticker", "underlying", "symbol")
+_SIDE_KEYS = ("side", "option_type", "type")
+_ACTION_KEYS = ("action", "direction", "trade_action")
+_STRIKE_KEYS = ("strike", "strike_price", "strikePrice")
+_EXPIRY_KEYS = ("expiry", "expiration", "expirationDate")
+_PRICE_KEYS = ("price", "option_price", "premium")
+_CONTRACTS_KEYS = ("contracts", "size", "qty", "quantity")
+_VOLUME_KEYS = ("volume", "trade_volume", "tradeVolume")
+_OPEN_INTEREST_KEYS = ("open_interest", "openInterest", "oi")
+_IV_KEYS = ("iv", "implied_volatility", "impliedVolatility")
+_UNDERLYING_PRICE_KEYS = ("underlying_price", "underlyingPrice", "underlyingPriceLast", "underlying")
+_BID_KEYS = ("bid", "bid_price")
+_ASK_KEYS = ("ask", "ask_price")
+_TIMESTAMP_KEYS = ("timestamp", "ts", "event_time", "time")
+_SWEEP_KEYS = ("is_sweep", "sweep", "isSweep")
+_AGGRESSIVE_KEYS = ("is_aggressive", "aggressive", "isAggressive", "at_ask", "atAsk")
+_BLOCK_KEYS = ("is_block", "block_trade")
+_MULTI_LEG_KEYS = ("is_multi_leg", "multi_leg")
+
+# Interned contract-type/side labels shared by every normalized event.
+CALL, PUT, BUY, SELL = map(sys.intern, ("CALL", "PUT", "BUY", "SELL"))
+
+_UTC = timezone.utc
+
+# Shared read-only fallback for missing nested snapshot sections; never mutated.
+_EMPTY: Dict[str, Any] = {}
+
+_NEW_EVENT_LOG = (
+    "[FLOW] New event detected | Ticker: %s | Side: %s | Action: %s | "
+    "Strike: %.2f | Expiry: %s | Contracts: %d | Notional: $%.2f | Underlying: %.2f"
+)
+
+# Contract type keyed by the first letter of the provider's side/type field.
+_CALL_PUT_BY_PREFIX = {"C": CALL, "P": PUT}
+
+
+def _first(raw: dict, keys: tuple, default: Any = None) -> Any:
+    """Return the first truthy value among ``keys`` in ``raw``, else ``default``."""
+
+    for key in keys:
+        value = raw.get(key)
+        if value:
+            return value
+    return default
+
+
+def _first_present(raw: dict, keys: tuple, default: Any = None) -> Any:
+    """Return the first non-``None`` value among ``keys``; zeros count as present."""
+
+    for key in keys:
+        value = raw.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+def _upper(value: Any) -> str:
+    """Uppercase ``value`` as text, skipping the copy when it already is."""
+
+    text = value if isinstance(value, str) else str(value)
+    return text if text.isupper() else text.upper()
+
+
+def _make_stub_events(tickers: tuple[str, ...], now: datetime) -> tuple[FlowEvent, ...]:
+    """Build the synthetic stub events for ``tickers`` anchored at ``now``."""
+
+    events = []
+    for idx, ticker in enumerate(tickers):
+        contracts = 100 + idx * 50
+        option_price = 1.25 + 0.25 * idx
+        strike = 100 + 5 * idx
+        underlying = strike - 1.0
+        expiry = (now + timedelta(days=7 + 3 * idx)).date()
+
+        events.append(
+            FlowEvent(
+                ticker=ticker,
+                call_put="CALL" if idx % 2 == 0 else "PUT",
+                side="BUY",
+                action="BUY",
+                strike=strike,
+                expiry=expiry,
+                option_price=option_price,
+                contracts=contracts,
+                notional=contracts * option_price * 100,
+                volume=5000 + idx * 1000,
+                open_interest=2000 + idx * 500,
+                underlying_price=underlying,
+                trade_time=now + timedelta(seconds=idx),
+                event_time=now + timedelta(seconds=idx),
+                exchange="",
+                is_sweep=True,
+                is_block=False,
+                is_aggressive=True,
+                is_multi_leg=False,
+                iv=0.35 + 0.02 * idx,
+                delta=None,
+                bid=None,
+                ask=None,
+                raw={"source": "stub_live"},
+            )
+        )
+    return tuple(events)
+
+
+# Stub events keyed by (tickers, build date); only timestamps are refreshed per call.
+_STUB_CACHE: Dict[tuple, tuple[FlowEvent, ...]] = {}
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_expiry(text: str) -> date:
+    """Parse an ISO expiry (date or datetime string); a handful recur all session."""
+
+    return date.fromisoformat(text.split("T", 1)[0])
+
+
+def _epoch_to_datetime(value: Any) -> datetime:
+    """Convert a provider epoch timestamp (nanoseconds, or milliseconds) to UTC."""
+
+    ts = float(value)
+    return datetime.fromtimestamp(ts * 1e-9 if ts > 1e14 else ts * 1e-3, _UTC)
+
+
+def _decode_json(resp: requests.Response) -> Any:
+    """Decode a provider response body, preferring orjson when installed."""
+
+    if orjson is None:
+        return resp.json()
+    content = resp.content
+    return orjson.loads(content) if content else None
+
+
+class LRUSet:
+    """Bounded set of recently seen keys; the least recently seen is evicted first."""
+
+    __slots__ = ("maxlen", "_items")
+
+    def __init__(self, maxlen: int = 1_000_000):
+        self.maxlen = maxlen
+        self._items: "OrderedDict[Any, None]" = OrderedDict()
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, key: Any) -> bool:
+        """Record ``key`` as most recently seen; return False if it was already present."""
+
+        items = self._items
+        if key in items:
+            items.move_to_end(key)
+            return False
+        items[key] = None
+        if len(items) > self.maxlen:
+            items.popitem(last=False)
+        return True
+
+
+@dataclass(slots=True)
+class FetchResult:
+    """Outcome of one option chain snapshot request made on a poll worker."""
+
+    underlying: str
+    payload: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
+    latency_ms: float = 0.0
+
+
 class FlowClient:
     """Client wrapper for streaming and historical options flow data."""
 
     def __init__(self, config: dict):
-        self.cfg = config
+        cfg = config if isinstance(config, dict) else {}
+        self.cfg = cfg
 
         # Centralized API key loading (shared Polygon/Massive key). Prefer the
         # injected config copy so callers can rely on load_config() as a single
         # source of truth.
-        api_keys = (config.get("api_keys") if isinstance(config, dict) else None) or load_api_keys()
+        api_keys = cfg.get("api_keys") or load_api_keys()
         self.polygon_massive_key = api_keys.get("polygon_massive") if api_keys else None
 
-        flow_cfg = (config or {}).get("flow", {}) if isinstance(config, dict) else {}
-        general_cfg = (config or {}).get("general", {}) if isinstance(config, dict) else {}
-        provider_cfg = (config or {}).get("provider", {}) if isinstance(config, dict) else {}
+        flow_cfg = cfg.get("flow") or {}
+        general_cfg = cfg.get("general") or {}
+        provider_cfg = cfg.get("provider") or {}
+        universe_cfg = cfg.get("universe") or {}
 
         # Allow provider name to be configured via either flow.provider or provider.name
         self.provider: str = str(
@@ -46,8 +233,28 @@ class FlowClient:
         self.massive_equity_snapshot_path: str = provider_cfg.get(
             "equity_snapshot_path", "/v2/snapshot/locale/us/markets/stocks/tickers"
         )
-
-        self.session = requests.Session()
+        # Snapshot endpoints are joined once; per-ticker URLs only append the symbol.
+        self._chain_endpoint = self._build_massive_url(live_flow_path=self.massive_option_chain_path)
+        self._chain_url_prefix = self._chain_endpoint + "/"
+        self._equity_endpoint = self._build_massive_url(
+            live_flow_path=self.massive_equity_snapshot_path
+        )
+        self._equity_url_prefix = self._equity_endpoint + "/"
+
+        # The HTTP session is built on first use so stub/test clients never
+        # set up connection pools or adapters.
+        self.http_retries: int = int(flow_cfg.get("http_retries", 3))
+        self._session: Optional[requests.Session] = None
+        self._logged_content_encoding = False
+        self._consec_err_count = 0
+        # Per-underlying monotonic deadlines set by 429s; throttled tickers are
+        # skipped until then while the rest of the universe keeps polling.
+        self._chain_cooldown_until: Dict[str, float] = {}
+        self.rate_limit_cooldown: float = float(flow_cfg.get("rate_limit_cooldown_seconds") or 30.0)
+        # Pool for concurrent snapshot requests, built on first poll like the
+        # session so stub/replay clients never create one; see close().
+        self.poll_concurrency: int = int(flow_cfg.get("poll_concurrency") or 16)
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.timeout: float = float(flow_cfg.get("timeout_seconds") or 5.0)
         self.max_event_age_minutes: float = float(general_cfg.get("max_event_age_minutes") or 180.0)
 
@@ -58,6 +265,16 @@ class FlowClient:
         else:
             self.massive_endpoint = self._build_massive_url()
         self.poll_interval: float = float(flow_cfg.get("poll_interval_seconds") or 3.0)
+        # Live snapshot polling cadence and universe size, resolved once.
+        self.live_poll_interval: int = int(
+            general_cfg.get("poll_interval_seconds", self.poll_interval)
+        )
+        self.max_tickers: int = int(universe_cfg.get("max_tickers") or 500)
+        # Optional bulk equity prefilter: when > 0, only underlyings whose day
+        # volume reaches this threshold get a per-ticker option chain request.
+        self.prefilter_min_volume: float = float(flow_cfg.get("prefilter_min_volume") or 0)
+        # Upper bound on remembered event ids; oldest ids are evicted first.
+        self.dedup_capacity: int = int(flow_cfg.get("dedup_capacity") or 500_000)
         self.use_stub: bool = bool(flow_cfg.get("use_stub"))
 
         if not self.polygon_massive_key:
@@ -67,10 +284,80 @@ class FlowClient:
             )
             self.use_stub = True
 
+        # Live source is fixed at construction; stream_live_flow just dispatches.
+        self._stream_impl = self._stream_stub_live if self.use_stub else self._stream_live_real
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled provider session, created lazily on first request."""
+
+        if self._session is None:
+            self._session = self._build_session()
+        return self._session
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool for concurrent chain requests, created lazily on first poll."""
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.poll_concurrency,
+                thread_name_prefix="flow-poll",
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Stop the polling pool and close the HTTP session, if either was created."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        # Authenticate once at the session level (Massive/Polygon accept a
+        # bearer token) so per-request params stay small and keys stay out of
+        # logged URLs.
+        if self.polygon_massive_key:
+            session.headers["Authorization"] = f"Bearer {self.polygon_massive_key}"
+        # Retry transient provider failures on the pooled connection with
+        # exponential backoff. 429s are not retried here: the rate limit is
+        # per key, so sleeping in every worker would stall the whole cycle;
+        # _handle_fetch_error cools the ticker down instead.
+        retry = Retry(
+            total=self.http_retries,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        # All traffic goes to one provider host, so only a few per-host pools
+        # are cached; each pool holds enough keep-alive sockets for every poll
+        # worker (plus headroom) so TLS sessions are reused across cycles.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(self.poll_concurrency * 2, 10),
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Advertise every compression scheme urllib3 can decode here (gzip and
+        # deflate, plus br/zstd when their optional decoders are installed).
+        session.headers.update(make_headers(accept_encoding=True))
+        session.headers["Accept"] = "application/json"
+        return session
+
     def get_top_volume_tickers(self, limit: int = 500) -> list[str]:
-        """Expose universe resolution for callers expecting a volume-ranked list."""
+        """Expose universe resolution for callers expecting a volume-ranked list.
+
+        :func:`resolve_universe` already caches successful dynamic results, so
+        this returns a fresh list each call.
+        """
 
-        return resolve_universe(self.cfg or {}, max_tickers=limit)
+        return list(resolve_universe(self.cfg, max_tickers=limit))
 
     def get_option_chain_snapshot(self, underlying: str, *, limit: int = 250) -> dict:
         """
@@ -78,11 +365,17 @@ class FlowClient:
         GET https://api.massive.com/v3/snapshot/options/{underlyingAsset}
         """
 
-        url = f"{self.massive_base_url.rstrip('/')}/{self.massive_option_chain_path.lstrip('/')}/{underlying}"
-        params = {"limit": limit, "apiKey": self.polygon_massive_key}
-        resp = self.session.get(url, params=params, timeout=self.timeout)
+        resp = self.session.get(
+            self._chain_url_prefix + underlying, params={"limit": limit}, timeout=self.timeout
+        )
         resp.raise_for_status()
-        return resp.json() or {}
+        if not self._logged_content_encoding:
+            self._logged_content_encoding = True
+            LOGGER.info(
+                "[API] Option chain snapshot Content-Encoding: %s",
+                resp.headers.get("Content-Encoding") or "identity",
+            )
+        return _decode_json(resp) or {}
 
     def get_equity_snapshot(self, ticker: str) -> dict:
         """
@@ -90,37 +383,49 @@ class FlowClient:
         GET https://api.massive.com/v2/snapshot/locale/us/markets/stocks/tickers/{stocksTicker}
         """
 
-        url = f"{self.massive_base_url.rstrip('/')}/{self.massive_equity_snapshot_path.lstrip('/')}/{ticker}"
-        params = {"apiKey": self.polygon_massive_key}
-        resp = self.session.get(url, params=params, timeout=self.timeout)
+        resp = self.session.get(self._equity_url_prefix + ticker, timeout=self.timeout)
         resp.raise_for_status()
-        return resp.json() or {}
+        return _decode_json(resp) or {}
+
+    def get_equity_snapshots(self, tickers: Sequence[str], *, chunk_size: int = 250) -> Dict[str, dict]:
+        """
+        Wrap Massive All Tickers Snapshot, filtered server-side to ``tickers``:
+        GET https://api.massive.com/v2/snapshot/locale/us/markets/stocks/tickers?tickers=A,B
+        Returns snapshots keyed by ticker; large lists are split into chunks.
+        """
+
+        snapshots: Dict[str, dict] = {}
+        for start in range(0, len(tickers), chunk_size):
+            resp = self.session.get(
+                self._equity_endpoint,
+                params={"tickers": ",".join(tickers[start : start + chunk_size])},
+                timeout=self.timeout,
+            )
+            resp.raise_for_status()
+            payload = _decode_json(resp) or {}
+            for item in payload.get("tickers") or ():
+                symbol = item.get("ticker")
+                if symbol:
+                    snapshots[symbol] = item
+        return snapshots
 
     def stream_live_flow(self) -> Iterator[FlowEvent]:
         """Yield FlowEvent objects in real time (infinite generator)."""
 
-        if self.use_stub:
-            LOGGER.warning("Using stub flow generator (use_stub=True).")
-            yield from self._stream_stub_flows()
-            return
+        return self._stream_impl()
 
-        if not self.polygon_massive_key:
-            LOGGER.warning(
-                "No Massive/Polygon API key configured; falling back to stub live flow."
-            )
-            yield from self._stream_stub_flows()
-            return
+    def _stream_stub_live(self) -> Iterator[FlowEvent]:
+        LOGGER.warning("Using stub flow generator (use_stub=True).")
+        yield from self._stream_stub_flows()
 
-        poll_interval = int(
-            (self.cfg.get("general") or {}).get("poll_interval_seconds", self.poll_interval)
-        )
+    def _stream_live_real(self) -> Iterator[FlowEvent]:
+        """Poll Massive option chain snapshots for the resolved universe forever."""
 
-        universe_cfg = (self.cfg.get("universe") or {}) if isinstance(self.cfg, dict) else {}
-        max_tickers = int(universe_cfg.get("max_tickers") or 500)
-        universe: List[str] = resolve_universe(self.cfg or {}, max_tickers=max_tickers)
+        poll_interval = self.live_poll_interval
+        universe = resolve_universe(self.cfg, max_tickers=self.max_tickers)
         self.universe_size = len(universe)
 
-        seen_ids: Set[str] = set()
+        seen_ids = LRUSet(self.dedup_capacity)
 
         LOGGER.info(
             "[UNIVERSE] FlowClient using universe of %d tickers for live options polling. Sample: %s",
@@ -130,11 +435,14 @@ class FlowClient:
 
         while True:
             try:
-                yield from self._poll_massive_option_chain(universe, seen_ids)
+                active = self._active_underlyings(universe)
+                yield from self._poll_massive_option_chain(active, seen_ids)
+                self._consec_err_count = 0
             except Exception as exc:  # pragma: no cover - network path
+                self._consec_err_count += 1
                 LOGGER.exception("Live flow polling error: %s", exc)
 
-            time.sleep(poll_interval)
+            time.sleep(self._next_poll_delay(poll_interval))
 
     def fetch_historical_flow(
         self, start: datetime, end: datetime, tickers: list[str] | None = None
@@ -187,166 +495,273 @@ class FlowClient:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _active_underlyings(self, universe: Sequence[str]) -> Sequence[str]:
+        """Narrow ``universe`` to underlyings trading enough to warrant a chain request.
+
+        Uses one or two bulk equity snapshot calls instead of a chain request per
+        ticker. Disabled unless ``flow.prefilter_min_volume`` is set; on failure
+        the full universe is polled.
+        """
+
+        if self.prefilter_min_volume <= 0:
+            return universe
+        try:
+            snapshots = self.get_equity_snapshots(universe)
+        except Exception:
+            LOGGER.warning("[API] Bulk equity snapshot failed; polling full universe", exc_info=True)
+            return universe
+
+        threshold = self.prefilter_min_volume
+        active = []
+        for ticker in universe:
+            snap = snapshots.get(ticker)
+            if not snap:
+                # No snapshot row: keep polling rather than silently drop it.
+                active.append(ticker)
+                continue
+            # Same day-bar key the universe ranker reads; "v" is the
+            # aggregate-style short form some payloads carry.
+            day = snap.get("day") or _EMPTY
+            if float(day.get("volume") or day.get("v") or 0) >= threshold:
+                active.append(ticker)
+        if not active:
+            LOGGER.warning(
+                "[UNIVERSE] Prefilter (day volume >= %.0f) removed all %d underlyings; "
+                "polling full universe",
+                threshold,
+                len(universe),
+            )
+            return universe
+        LOGGER.info(
+            "[UNIVERSE] Prefilter kept %d/%d underlyings (day volume >= %.0f)",
+            len(active),
+            len(universe),
+            threshold,
+        )
+        return active
+
+    def _fetch_option_chain(self, underlying: str) -> FetchResult:
+        """Fetch one option chain snapshot on a worker thread, capturing any error."""
+
+        start_ts = time.monotonic()
+        LOGGER.info(
+            "[API] Requesting option chain snapshot | Ticker: %s | Endpoint: %s",
+            underlying,
+            self._chain_endpoint,
+        )
+        try:
+            payload = self.get_option_chain_snapshot(underlying)
+        except Exception as exc:
+            return FetchResult(
+                underlying, error=exc, latency_ms=(time.monotonic() - start_ts) * 1000
+            )
+        latency_ms = (time.monotonic() - start_ts) * 1000
+        contracts_count = len((payload.get("results") if isinstance(payload, dict) else []) or [])
+        LOGGER.info(
+            "[API] Success: option chain | Ticker: %s | Contracts Returned: %s | Latency: %.0f ms",
+            underlying,
+            contracts_count,
+            latency_ms,
+        )
+        return FetchResult(underlying, payload=payload, latency_ms=latency_ms)
+
+    def _handle_fetch_error(self, result: FetchResult) -> None:
+        """Log a failed snapshot fetch; credential rejections abort the cycle."""
+
+        underlying, exc = result.underlying, result.error
+        if not isinstance(exc, requests.HTTPError):
+            LOGGER.error(
+                "[API] Unexpected error when calling Massive options snapshot | Ticker: %s",
+                underlying,
+                exc_info=exc,
+            )
+            return
+
+        response = exc.response
+        status = response.status_code if response is not None else "unknown"
+        if status in (401, 403):
+            LOGGER.error(
+                "[API] Massive rejected credentials | Status: %s | Aborting poll cycle",
+                status,
+            )
+            raise exc
+        if status == 429:
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else self.rate_limit_cooldown
+            self._chain_cooldown_until[underlying] = time.monotonic() + delay
+            LOGGER.warning(
+                "[API] 429 from Massive options snapshot | Ticker: %s | Skipping for %.0fs",
+                underlying,
+                delay,
+            )
+        elif status == 404:
+            LOGGER.warning(
+                (
+                    "[API] 404 from Massive options snapshot | Ticker: %s | "
+                    "This may indicate plan/entitlement limits or unsupported ticker."
+                ),
+                underlying,
+            )
+        else:
+            LOGGER.error(
+                "[API] ERROR: Massive request failed | Ticker: %s | Status: %s",
+                underlying,
+                status,
+            )
+
     def _poll_massive_option_chain(
-        self, universe: List[str], seen_ids: Set[str]
+        self, universe: Sequence[str], seen_ids: LRUSet
     ) -> Iterator[FlowEvent]:
-        """Poll Massive Option Chain Snapshot and yield new FlowEvents."""
+        """Poll Massive Option Chain Snapshot and yield new FlowEvents.
+
+        Snapshot requests are fanned out over the client's thread pool; each
+        worker returns a FetchResult, which is logged or normalized in
+        completion order on the calling thread. Underlyings cooling down after
+        a 429 are skipped this cycle.
+        """
 
         now = datetime.now(timezone.utc)
         max_age = timedelta(minutes=self.max_event_age_minutes)
 
-        for underlying in universe:
-            start_ts = time.monotonic()
-            LOGGER.info(
-                "[API] Requesting option chain snapshot | Ticker: %s | Endpoint: %s/%s",
-                underlying,
-                self.massive_base_url,
-                self.massive_option_chain_path.lstrip("/"),
-            )
-            try:
-                payload: Dict[str, Any] = self.get_option_chain_snapshot(underlying)
-                latency_ms = (time.monotonic() - start_ts) * 1000
-                contracts_count = len((payload.get("results") if isinstance(payload, dict) else []) or [])
-                LOGGER.info(
-                    "[API] Success: option chain | Ticker: %s | Contracts Returned: %s | Latency: %.0f ms",
-                    underlying,
-                    contracts_count,
-                    latency_ms,
-                )
-            except requests.HTTPError as exc:
-                status = exc.response.status_code if exc.response else "unknown"
-                if status == 404:
-                    LOGGER.warning(
-                        (
-                            "[API] 404 from Massive options snapshot | Ticker: %s | "
-                            "This may indicate plan/entitlement limits or unsupported ticker."
-                        ),
-                        underlying,
-                    )
-                else:
-                    LOGGER.error(
-                        "[API] ERROR: Massive request failed | Ticker: %s | Status: %s",
-                        underlying,
-                        status,
-                    )
-                continue
-            except Exception as exc:
-                LOGGER.exception(
-                    "[API] Unexpected error when calling Massive options snapshot | Ticker: %s",
-                    underlying,
+        cooldown = self._chain_cooldown_until
+        if cooldown:
+            mono = time.monotonic()
+            for ticker in [t for t, until in cooldown.items() if until <= mono]:
+                del cooldown[ticker]
+            universe = [t for t in universe if t not in cooldown]
+
+        futures = [
+            self.executor.submit(self._fetch_option_chain, underlying)
+            for underlying in universe
+        ]
+        try:
+            for future in as_completed(futures):
+                result: FetchResult = future.result()
+                if result.error is not None:
+                    self._handle_fetch_error(result)
+                    continue
+                yield from self._normalize_chain(
+                    result.underlying, result.payload, seen_ids, now, max_age
                 )
-                continue
+        finally:
+            # Drop queued requests if the cycle aborts or the consumer stops early.
+            for future in futures:
+                future.cancel()
+
+    def _normalize_chain(
+        self,
+        underlying: str,
+        payload: Dict[str, Any],
+        seen_ids: LRUSet,
+        now: datetime,
+        max_age: timedelta,
+    ) -> Iterator[FlowEvent]:
+        """Normalize one option chain snapshot into new, deduplicated FlowEvents."""
 
-            results = (payload.get("results") if isinstance(payload, dict) else []) or []
+        results = (payload.get("results") if isinstance(payload, dict) else []) or []
+        today = now.date()
+        # Per-event detail is DEBUG-only; the level check is hoisted out of the loop.
+        log_events = LOGGER.isEnabledFor(logging.DEBUG)
+        start_ts = time.monotonic()
+        new_count = 0
 
-            for contract in results:
-                try:
-                    details = contract.get("details") or {}
-                    last_trade = contract.get("last_trade") or {}
-                    if not last_trade:
-                        continue
-
-                    option_ticker = details.get("ticker") or ""
-                    ts_ns = last_trade.get("sip_timestamp") or last_trade.get("t")
-                    if not option_ticker or not ts_ns:
-                        continue
-
-                    try:
-                        ts_sec = float(ts_ns) / 1e9
-                    except Exception:
-                        ts_sec = float(ts_ns) / 1000.0
-                    event_time = datetime.fromtimestamp(ts_sec, tz=timezone.utc)
-
-                    age = now - event_time
-                    if age > max_age:
-                        LOGGER.debug(
-                            "[FLOW] Skipping stale event %s (age %.1f min)", option_ticker, age.total_seconds() / 60.0
-                        )
-                        continue
-                    if age < -timedelta(minutes=5):
-                        LOGGER.debug(
-                            "[FLOW] Skipping future-dated event %s (age %.1f min)",
-                            option_ticker,
-                            age.total_seconds() / 60.0,
-                        )
-                        continue
-
-                    unique_id = f"{underlying}:{option_ticker}:{ts_ns}"
-                    if unique_id in seen_ids:
-                        LOGGER.debug("[FLOW] Skipping duplicate event %s", unique_id)
-                        continue
-                    seen_ids.add(unique_id)
-
-                    call_put = (details.get("contract_type") or "").upper()
-                    strike = float(details.get("strike_price") or 0.0)
-                    expiry_raw = details.get("expiration_date")
-                    expiry = (
-                        datetime.strptime(expiry_raw, "%Y-%m-%d").date()
-                        if expiry_raw
-                        else date.today()
-                    )
+        for contract in results:
+            try:
+                details = contract.get("details") or _EMPTY
+                last_trade = contract.get("last_trade") or _EMPTY
+                if not last_trade:
+                    continue
 
-                    option_price = float(last_trade.get("price") or 0.0)
-                    contracts = int(last_trade.get("size") or 0)
-                    notional = option_price * contracts * 100.0
-
-                    bid_val = last_trade.get("bid") or last_trade.get("bid_price")
-                    ask_val = last_trade.get("ask") or last_trade.get("ask_price")
-                    bid = float(bid_val) if bid_val is not None else None
-                    ask = float(ask_val) if ask_val is not None else None
-
-                    day = contract.get("day") or {}
-                    volume = int(day.get("volume") or 0)
-                    open_interest = int(contract.get("open_interest") or 0)
-                    iv_val = contract.get("implied_volatility")
-                    iv = float(iv_val) if iv_val is not None else None
-
-                    underlying_asset = contract.get("underlying_asset") or {}
-                    underlying_price = float(
-                        underlying_asset.get("price")
-                        or underlying_asset.get("last_price")
-                        or 0.0
-                    )
+                option_ticker = details.get("ticker") or ""
+                ts_ns = last_trade.get("sip_timestamp") or last_trade.get("t")
+                if not option_ticker or not ts_ns:
+                    continue
 
-                    exchange = str(
-                        details.get("exchange")
-                        or contract.get("exchange")
-                        or last_trade.get("exchange")
-                        or ""
+                event_time = _epoch_to_datetime(ts_ns)
+
+                age = now - event_time
+                if age > max_age:
+                    LOGGER.debug(
+                        "[FLOW] Skipping stale event %s (age %.1f min)", option_ticker, age.total_seconds() / 60.0
                     )
-                    order_side = str(last_trade.get("side") or "BUY").upper()
-
-                    event = FlowEvent(
-                        ticker=underlying,
-                        call_put=call_put,
-                        side=order_side,
-                        action=order_side,
-                        strike=strike,
-                        expiry=expiry,
-                        option_price=option_price,
-                        contracts=contracts,
-                        notional=notional,
-                        volume=volume,
-                        open_interest=open_interest,
-                        underlying_price=underlying_price,
-                        trade_time=event_time,
-                        event_time=event_time,
-                        exchange=exchange,
-                        is_sweep=False,
-                        is_block=bool(contract.get("is_block") or contract.get("block_trade")),
-                        is_aggressive=False,
-                        is_multi_leg=bool(contract.get("is_multi_leg") or contract.get("multi_leg")),
-                        iv=iv,
-                        delta=None,
-                        bid=bid,
-                        ask=ask,
-                        raw=contract,
+                    continue
+                if age < -timedelta(minutes=5):
+                    LOGGER.debug(
+                        "[FLOW] Skipping future-dated event %s (age %.1f min)",
+                        option_ticker,
+                        age.total_seconds() / 60.0,
                     )
-                    LOGGER.info(
-                        (
-                            "[FLOW] New event detected | Ticker: %s | Side: %s | Action: %s | "
-                            "Strike: %.2f | Expiry: %s | Contracts: %d | Notional: $%.2f | Underlying: %.2f"
-                        ),
+                    continue
+
+                unique_id = (underlying, option_ticker, ts_ns)
+                if not seen_ids.add(unique_id):
+                    LOGGER.debug("[FLOW] Skipping duplicate event %s:%s:%s", *unique_id)
+                    continue
+
+                call_put = sys.intern(_upper(details.get("contract_type") or ""))
+                strike = float(details.get("strike_price") or 0.0)
+                expiry_raw = details.get("expiration_date")
+                expiry = _parse_expiry(expiry_raw) if expiry_raw else today
+
+                option_price = float(last_trade.get("price") or 0.0)
+                contracts = int(last_trade.get("size") or 0)
+                notional = option_price * contracts * 100.0
+
+                bid_val = last_trade.get("bid") or last_trade.get("bid_price")
+                ask_val = last_trade.get("ask") or last_trade.get("ask_price")
+                bid = float(bid_val) if bid_val is not None else None
+                ask = float(ask_val) if ask_val is not None else None
+
+                day = contract.get("day") or _EMPTY
+                volume = int(day.get("volume") or 0)
+                open_interest = int(contract.get("open_interest") or 0)
+                iv_val = contract.get("implied_volatility")
+                iv = float(iv_val) if iv_val is not None else None
+
+                underlying_asset = contract.get("underlying_asset") or _EMPTY
+                underlying_price = float(
+                    underlying_asset.get("price")
+                    or underlying_asset.get("last_price")
+                    or 0.0
+                )
+
+                exchange = str(
+                    details.get("exchange")
+                    or contract.get("exchange")
+                    or last_trade.get("exchange")
+                    or ""
+                )
+                order_side = sys.intern(_upper(last_trade.get("side") or BUY))
+
+                event = FlowEvent(
+                    ticker=underlying,
+                    call_put=call_put,
+                    side=order_side,
+                    action=order_side,
+                    strike=strike,
+                    expiry=expiry,
+                    option_price=option_price,
+                    contracts=contracts,
+                    notional=notional,
+                    volume=volume,
+                    open_interest=open_interest,
+                    underlying_price=underlying_price,
+                    trade_time=event_time,
+                    event_time=event_time,
+                    exchange=exchange,
+                    is_sweep=False,
+                    is_block=bool(contract.get("is_block") or contract.get("block_trade")),
+                    is_aggressive=False,
+                    is_multi_leg=bool(contract.get("is_multi_leg") or contract.get("multi_leg")),
+                    iv=iv,
+                    delta=None,
+                    bid=bid,
+                    ask=ask,
+                    raw=contract,
+                )
+                if log_events:
+                    LOGGER.debug(
+                        _NEW_EVENT_LOG,
                         underlying,
                         call_put,
                         event.action,
@@ -356,12 +771,29 @@ class FlowClient:
                         notional,
                         underlying_price,
                     )
-                    yield event
-                except Exception:
-                    LOGGER.exception(
-                        "Failed to normalize Massive snapshot contract for %s", underlying
-                    )
-                    continue
+                new_count += 1
+                yield event
+            except Exception:
+                LOGGER.exception(
+                    "Failed to normalize Massive snapshot contract for %s", underlying
+                )
+                continue
+
+        if new_count:
+            LOGGER.info(
+                "[FLOW] %d new events for %s (%.0f ms)",
+                new_count,
+                underlying,
+                (time.monotonic() - start_ts) * 1000,
+            )
+
+    def _next_poll_delay(self, poll_interval: float) -> float:
+        """Return the sleep before the next poll, backing off after failed cycles."""
+
+        if not self._consec_err_count:
+            return poll_interval
+        backoff = poll_interval * (2 ** min(self._consec_err_count, 6))
+        return min(backoff, 60.0) * random.uniform(0.8, 1.2)
 
     def _build_massive_url(self, base_url: Optional[str] = None, live_flow_path: Optional[str] = None) -> str:
         """Construct the Massive live flow URL from config components."""
@@ -370,60 +802,58 @@ class FlowClient:
         path = (live_flow_path or self.massive_live_flow_path).lstrip("/")
         return f"{base}/{path}"
 
-    def _map_provider_event(self, raw: dict) -> Optional[FlowEvent]:
-        """Convert provider JSON dict to FlowEvent; return None on failure."""
+    def _map_provider_event(self, raw: dict, now: Optional[datetime] = None) -> Optional[FlowEvent]:
+        """Convert provider JSON dict to FlowEvent; return None on failure.
 
+        ``now`` should be read once per batch by the caller; it backs the
+        fallback expiry and event time for records that omit them.
+        """
+
+        if now is None:
+            now = datetime.now(timezone.utc)
         try:
-            ticker = str(raw.get("ticker") or raw.get("underlying") or raw.get("symbol") or "").upper()
+            ticker = sys.intern(_upper(_first(raw, _TICKER_KEYS, "")))
             if not ticker:
                 return None
 
-            side_raw = str(raw.get("side") or raw.get("option_type") or raw.get("type") or "CALL").upper()
-            call_put = "CALL" if side_raw.startswith("C") else "PUT"
+            side_raw = _upper(_first(raw, _SIDE_KEYS, CALL))
+            call_put = _CALL_PUT_BY_PREFIX.get(side_raw[:1], PUT)
 
-            action_raw = str(raw.get("action") or raw.get("direction") or raw.get("trade_action") or "BUY").upper()
-            action = "BUY" if "S" not in action_raw else "SELL"
+            action_raw = _upper(_first(raw, _ACTION_KEYS, BUY))
+            action = BUY if "S" not in action_raw else SELL
 
-            strike = float(raw.get("strike") or raw.get("strike_price") or raw.get("strikePrice") or 0.0)
-            expiry_raw = raw.get("expiry") or raw.get("expiration") or raw.get("expirationDate")
+            strike = float(_first_present(raw, _STRIKE_KEYS, 0.0))
+            expiry_raw = _first(raw, _EXPIRY_KEYS)
             expiry = (
-                date.fromisoformat(str(expiry_raw).split("T")[0])
+                _parse_expiry(str(expiry_raw))
                 if expiry_raw
-                else (datetime.now(timezone.utc) + timedelta(days=7)).date()
+                else (now + timedelta(days=7)).date()
             )
 
-            option_price = float(raw.get("price") or raw.get("option_price") or raw.get("premium") or 0.0)
-            contracts = int(raw.get("contracts") or raw.get("size") or raw.get("qty") or raw.get("quantity") or 0)
-            notional = float(raw.get("notional") or (contracts * option_price * 100))
-
-            is_sweep = bool(raw.get("is_sweep") or raw.get("sweep") or raw.get("isSweep"))
-            is_aggressive = bool(
-                raw.get("is_aggressive")
-                or raw.get("aggressive")
-                or raw.get("isAggressive")
-                or raw.get("at_ask")
-                or raw.get("atAsk")
+            option_price = float(_first_present(raw, _PRICE_KEYS, 0.0))
+            contracts = int(_first_present(raw, _CONTRACTS_KEYS, 0))
+            notional_val = raw.get("notional")
+            notional = (
+                float(notional_val) if notional_val is not None else contracts * option_price * 100
             )
 
-            volume = int(raw.get("volume") or raw.get("trade_volume") or raw.get("tradeVolume") or contracts)
-            open_interest = int(raw.get("open_interest") or raw.get("openInterest") or raw.get("oi") or 0)
-            iv_val = raw.get("iv") or raw.get("implied_volatility") or raw.get("impliedVolatility")
+            is_sweep = bool(_first(raw, _SWEEP_KEYS))
+            is_aggressive = bool(_first(raw, _AGGRESSIVE_KEYS))
+
+            volume = int(_first_present(raw, _VOLUME_KEYS, contracts))
+            open_interest = int(_first_present(raw, _OPEN_INTEREST_KEYS, 0))
+            iv_val = _first_present(raw, _IV_KEYS)
             iv = float(iv_val) if iv_val is not None else None
 
-            underlying_price = float(
-                raw.get("underlying_price")
-                or raw.get("underlyingPrice")
-                or raw.get("underlyingPriceLast")
-                or raw.get("underlying")
-                or strike
-            )
+            underlying_price = float(_first_present(raw, _UNDERLYING_PRICE_KEYS, strike))
 
-            bid_val = raw.get("bid") or raw.get("bid_price")
-            ask_val = raw.get("ask") or raw.get("ask_price")
+            bid_val = _first_present(raw, _BID_KEYS)
+            ask_val = _first_present(raw, _ASK_KEYS)
             bid = float(bid_val) if bid_val is not None else None
             ask = float(ask_val) if ask_val is not None else None
+            delta_val = raw.get("delta")
 
-            ts_raw = raw.get("timestamp") or raw.get("ts") or raw.get("event_time") or raw.get("time")
+            ts_raw = _first(raw, _TIMESTAMP_KEYS)
             event_time = None
             if isinstance(ts_raw, (int, float)):
                 event_time = datetime.fromtimestamp(ts_raw, tz=timezone.utc)
@@ -431,9 +861,9 @@ class FlowClient:
                 try:
                     event_time = datetime.fromisoformat(str(ts_raw).replace("Z", "+00:00"))
                 except Exception:  # pragma: no cover - defensive
-                    event_time = datetime.now(timezone.utc)
+                    event_time = now
             else:
-                event_time = datetime.now(timezone.utc)
+                event_time = now
 
             return FlowEvent(
                 ticker=ticker,
@@ -452,11 +882,11 @@ class FlowClient:
                 event_time=event_time,
                 exchange=str(raw.get("exchange") or ""),
                 is_sweep=is_sweep,
-                is_block=bool(raw.get("is_block") or raw.get("block_trade")),
+                is_block=bool(_first(raw, _BLOCK_KEYS)),
                 is_aggressive=is_aggressive,
-                is_multi_leg=bool(raw.get("is_multi_leg") or raw.get("multi_leg")),
+                is_multi_leg=bool(_first(raw, _MULTI_LEG_KEYS)),
                 iv=iv,
-                delta=float(raw.get("delta")) if raw.get("delta") is not None else None,
+                delta=float(delta_val) if delta_val is not None else None,
                 bid=bid,
                 ask=ask,
                 raw=raw,
@@ -465,13 +895,23 @@ class FlowClient:
             LOGGER.warning("Skipping malformed provider event: %s (err=%s)", raw, exc)
             return None
 
-    def _event_identity(self, raw: dict, event: FlowEvent) -> str:
-        """Generate a dedup key for a raw provider event."""
+    def _event_identity(self, raw: dict, event: FlowEvent) -> Union[str, tuple]:
+        """Generate a dedup key for a raw provider event.
+
+        Provider ids are used verbatim when present; otherwise the key is a
+        tuple of the event's identifying fields, which hashes without building
+        an intermediate string.
+        """
 
-        return str(
-            raw.get("id")
-            or raw.get("uuid")
-            or f"{event.ticker}-{event.strike}-{event.expiry.isoformat()}-{event.contracts}-{int(event.event_time.timestamp())}"
+        provider_id = raw.get("id") or raw.get("uuid")
+        if provider_id:
+            return str(provider_id)
+        return (
+            event.ticker,
+            event.strike,
+            event.expiry.toordinal(),
+            event.contracts,
+            int(event.event_time.timestamp()),
         )
 
     def _stream_stub_flows(self) -> Iterator[FlowEvent]:
@@ -482,36 +922,13 @@ class FlowClient:
         ) or ["SPY", "QQQ", "TSLA"]
 
         now = datetime.now(timezone.utc)
-        for idx, ticker in enumerate(sample_tickers[:3]):
-            contracts = 100 + idx * 50
-            option_price = 1.25 + 0.25 * idx
-            strike = 100 + 5 * idx
-            underlying = strike - 1.0
-            expiry = (now + timedelta(days=7 + 3 * idx)).date()
-
-            yield FlowEvent(
-                ticker=ticker,
-                call_put="CALL" if idx % 2 == 0 else "PUT",
-                side="BUY",
-                action="BUY",
-                strike=strike,
-                expiry=expiry,
-                option_price=option_price,
-                contracts=contracts,
-                notional=contracts * option_price * 100,
-                volume=5000 + idx * 1000,
-                open_interest=2000 + idx * 500,
-                underlying_price=underlying,
-                trade_time=now + timedelta(seconds=idx),
-                event_time=now + timedelta(seconds=idx),
-                exchange="",
-                is_sweep=True,
-                is_block=False,
-                is_aggressive=True,
-                is_multi_leg=False,
-                iv=0.35 + 0.02 * idx,
-                delta=None,
-                bid=None,
-                ask=None,
-                raw={"source": "stub_live"},
-            )
+        key = (tuple(sample_tickers[:3]), now.date())
+        events = _STUB_CACHE.get(key)
+        if events is None:
+            # Expiries are anchored to the build date, so keep one day's set only.
+            _STUB_CACHE.clear()
+            events = _STUB_CACHE[key] = _make_stub_events(key[0], now)
+
+        for idx, event in enumerate(events):
+            ts = now + timedelta(seconds=idx)
+            yield replace(event, trade_time=ts, event_time=ts)
@@ -1,6 +1,7 @@
 """Simple heartbeat/status tracker."""
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 
 
@@ -9,14 +10,14 @@ class Heartbeat:
         self.last_reset = datetime.now(timezone.utc)
         self.events_processed = 0
         self.signals_generated = 0
-        self.signals_by_kind: dict[str, int] = {}
+        self.signals_by_kind: Counter[str] = Counter()
 
     def record_event(self):
         self.events_processed += 1
 
     def record_signal(self, signal_kind: str):
         self.signals_generated += 1
-        self.signals_by_kind[signal_kind] = self.signals_by_kind.get(signal_kind, 0) + 1
+        self.signals_by_kind[signal_kind] += 1
 
     def snapshot(self) -> str:
         now = datetime.now(timezone.utc)
@@ -29,7 +30,7 @@ class Heartbeat:
             f"• Signals: {self.signals_generated}",
             "• Signals by kind:",
         ]
-        for kind, count in self.signals_by_kind.items():
+        for kind, count in self.signals_by_kind.most_common():
             lines.append(f"  - {kind}: {count}")
         return "\n".join(lines)
 
@@ -1,104 +1,199 @@
 """Logging utilities for signals and paper trades."""
 from __future__ import annotations
 
+import abc
+import atexit
 import csv
+import logging
+import os
+import queue
+import threading
+import time
 from pathlib import Path
 
 from .models import PaperPosition, Signal
 
+LOGGER = logging.getLogger(__name__)
 
-class SignalLogger:
-    def __init__(self, path: str = "signals_log.csv"):
+
+# Queue marker that tells the writer thread to drain and exit.
+_STOP = object()
+
+
+class _CsvLogger(abc.ABC):
+    """Append-only CSV log written by a background thread.
+
+    Callers only enqueue the record object; the writer thread converts
+    records to rows via ``_to_row``, batches them (up to ``batch_size`` rows or
+    ``flush_interval`` seconds) into ``writerows`` and flushes, fsyncing at
+    most once per ``fsync_interval``. Disk I/O and row formatting stay off the
+    event loop.
+    """
+
+    header: tuple[str, ...] = ()
+    batch_size: int = 100
+    flush_interval: float = 0.2
+    fsync_interval: float = 1.0
+
+    def __init__(self, path: str):
         self.path = Path(path)
         self._ensure_header()
+        self._fh = self.path.open("a", newline="", buffering=1 << 16)
+        self._writer = csv.writer(self._fh)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._writer_loop, name=f"csv-{self.path.stem}", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
 
     def _ensure_header(self):
         if not self.path.exists():
             with self.path.open("w", newline="") as f:
                 writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        "timestamp",
-                        "ticker",
-                        "kind",
-                        "direction",
-                        "strength",
-                        "tags",
-                        "experiment_id",
-                        "underlying_price",
-                        "notes",
-                    ]
-                )
+                writer.writerow(self.header)
+
+    def _enqueue(self, record: object) -> None:
+        self._queue.put(record)
+
+    @abc.abstractmethod
+    def _to_row(self, record) -> tuple:
+        """Convert a queued record into one CSV row."""
+
+    def _writer_loop(self) -> None:
+        get = self._queue.get
+        last_fsync = time.monotonic()
+        while True:
+            batch = [get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            rows = []
+            control = []
+            for item in batch:
+                if item is _STOP or isinstance(item, threading.Event):
+                    control.append(item)
+                else:
+                    # A bad record must not kill the writer thread and lose
+                    # every row queued behind it.
+                    try:
+                        rows.append(self._to_row(item))
+                    except Exception:
+                        LOGGER.exception("[LOG] Skipping unwritable record for %s", self.path)
+            if rows:
+                self._writer.writerows(rows)
+                self._fh.flush()
+                now = time.monotonic()
+                if control or now - last_fsync >= self.fsync_interval:
+                    os.fsync(self._fh.fileno())
+                    last_fsync = now
+            for item in control:
+                if item is not _STOP:
+                    item.set()
+            if _STOP in control:
+                return
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until rows queued so far are written to disk."""
+
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait(timeout)
+
+    def close(self) -> None:
+        """Drain queued rows, stop the writer thread and close the file; idempotent."""
+
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout=5.0)
+        if not self._fh.closed:
+            self._fh.close()
+
+
+class SignalLogger(_CsvLogger):
+    header = (
+        "timestamp",
+        "ticker",
+        "kind",
+        "direction",
+        "strength",
+        "tags",
+        "experiment_id",
+        "underlying_price",
+        "notes",
+    )
+
+    def __init__(self, path: str = "signals_log.csv"):
+        super().__init__(path)
 
     def log_signal(self, signal: Signal):
+        self._enqueue(signal)
+
+    def _to_row(self, signal: Signal) -> tuple:
         underlying_price = signal.flow_events[0].underlying_price if signal.flow_events else None
-        with self.path.open("a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    signal.created_at.isoformat(),
-                    signal.ticker,
-                    signal.kind,
-                    signal.direction,
-                    signal.strength,
-                    "|".join(signal.tags),
-                    signal.experiment_id,
-                    underlying_price,
-                    "",
-                ]
-            )
-
-
-class PaperTradeLogger:
-    def __init__(self, path: str = "paper_trades_log.csv"):
-        self.path = Path(path)
-        self._ensure_header()
+        return (
+            signal.created_at.isoformat(),
+            signal.ticker,
+            signal.kind,
+            signal.direction,
+            signal.strength,
+            "|".join(signal.tags),
+            signal.experiment_id,
+            underlying_price,
+            "",
+        )
 
-    def _ensure_header(self):
-        if not self.path.exists():
-            with self.path.open("w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        "position_id",
-                        "ticker",
-                        "side",
-                        "opened_at",
-                        "entry_price",
-                        "closed_at",
-                        "exit_price",
-                        "outcome",
-                        "signal_id",
-                        "tp_pct",
-                        "sl_pct",
-                        "max_hold_seconds",
-                        "pnl_pct",
-                    ]
-                )
+
+class PaperTradeLogger(_CsvLogger):
+    header = (
+        "position_id",
+        "ticker",
+        "side",
+        "opened_at",
+        "entry_price",
+        "closed_at",
+        "exit_price",
+        "outcome",
+        "signal_id",
+        "tp_pct",
+        "sl_pct",
+        "max_hold_seconds",
+        "pnl_pct",
+    )
+
+    def __init__(self, path: str = "paper_trades_log.csv"):
+        super().__init__(path)
 
     def log_position(self, pos: PaperPosition):
+        self._enqueue(pos)
+
+    def _to_row(self, pos: PaperPosition) -> tuple:
         pnl_pct = None
         if pos.exit_price and pos.entry_price:
             pnl_pct = (pos.exit_price - pos.entry_price) / pos.entry_price * 100.0
             if pos.side == "LONG_PUT":
                 pnl_pct *= -1
 
-        with self.path.open("a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    pos.id,
-                    pos.ticker,
-                    pos.side,
-                    pos.opened_at.isoformat(),
-                    pos.entry_price,
-                    pos.closed_at.isoformat() if pos.closed_at else None,
-                    pos.exit_price,
-                    pos.outcome,
-                    pos.signal_id,
-                    pos.tp_pct,
-                    pos.sl_pct,
-                    pos.max_hold_seconds,
-                    pnl_pct,
-                ]
-            )
+        return (
+            pos.id,
+            pos.ticker,
+            pos.side,
+            pos.opened_at.isoformat(),
+            pos.entry_price,
+            pos.closed_at.isoformat() if pos.closed_at else None,
+            pos.exit_price,
+            pos.outcome,
+            pos.signal_id,
+            pos.tp_pct,
+            pos.sl_pct,
+            pos.max_hold_seconds,
+            pnl_pct,
+        )
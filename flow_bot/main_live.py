@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
-from datetime import datetime, timedelta, timezone
+from typing import Sequence
 
 from .universe import resolve_universe
 
@@ -13,18 +14,27 @@ from .config import load_config
 from .flow_client import FlowClient
 from .heartbeat import Heartbeat
 from .logging_config import configure_logging
-from .logging_utils import SignalLogger
+from .logging_utils import PaperTradeLogger, SignalLogger
 from .paper_trading import PaperTradingEngine
-from .routes import route_signal, send_alert
+from .routes import dispatch_alert, route_signal
 from .signal_engine import SignalEngine
 
 LOGGER = logging.getLogger(__name__)
 
+# Alert formatter per route mode; unknown modes fall back to the medium layout.
+_FORMATTERS = {
+    "short": format_short_alert,
+    "deep_dive": format_deep_dive_alert,
+    "medium": format_medium_alert,
+}
 
-def _log_startup_summary(cfg: dict, universe: list[str] | None = None) -> None:
+
+def _log_startup_summary(
+    cfg: dict, universe: Sequence[str] | None = None, env_name: str | None = None
+) -> None:
     """Emit a human-friendly startup block showing connectivity and config state."""
 
-    env_name = "Render" if os.getenv("RENDER") else "Local"
+    env_name = env_name or ("Render" if os.getenv("RENDER") else "Local")
     api_keys = cfg.get("api_keys") or {}
     has_provider_key = bool(api_keys.get("polygon_massive"))
     has_telegram_token = bool(os.getenv("TELEGRAM_BOT_TOKEN"))
@@ -62,29 +72,55 @@ def _log_startup_summary(cfg: dict, universe: list[str] | None = None) -> None:
     LOGGER.info("\n".join(lines))
 
 
+def _start_ticker(interval: float, name: str) -> threading.Event:
+    """Return an event that a daemon thread sets every ``interval`` seconds.
+
+    Lets the live loop check a flag per event instead of reading the clock.
+    """
+
+    due = threading.Event()
+
+    def _tick() -> None:
+        while True:
+            time.sleep(interval)
+            due.set()
+
+    threading.Thread(target=_tick, name=name, daemon=True).start()
+    return due
+
+
 def main():
     configure_logging()
     cfg = load_config()
 
+    env_name = "Render" if os.getenv("RENDER") else "Local"
     LOGGER.info("================================================")
     LOGGER.info(" Prime Flow AI live worker starting")
-    LOGGER.info(" Environment: %s", "Render" if os.getenv("RENDER") else "Local")
+    LOGGER.info(" Environment: %s", env_name)
     LOGGER.info("================================================")
     universe = resolve_universe(cfg, max_tickers=int((cfg.get("universe") or {}).get("max_tickers") or 500))
-    _log_startup_summary(cfg, universe)
+    _log_startup_summary(cfg, universe, env_name)
 
     client = FlowClient(cfg)
-    engine = SignalEngine(cfg)
+    engine = SignalEngine(cfg, universe)
     logger = SignalLogger()
     paper_engine = PaperTradingEngine(cfg)
+    paper_logger = PaperTradeLogger()
     hb = Heartbeat()
-    last_heartbeat_log = time.monotonic()
     heartbeat_interval_seconds = 60.0
+    heartbeat_due = _start_ticker(heartbeat_interval_seconds, "heartbeat-ticker")
+    # Paper positions are marked against the latest underlying price seen per
+    # ticker once a second, on the loop thread between events. They are timed
+    # on the event clock (positions open at the signal's event time), so old
+    # prints do not time out against wall-clock time.
+    latest_prices: dict[str, float] = {}
+    paper_update_due = _start_ticker(1.0, "paper-ticker")
 
     try:
         for event in client.stream_live_flow():
             now = event.event_time
             hb.record_event()
+            latest_prices[event.ticker] = event.underlying_price
 
             signals = engine.process_event(event, now)
             for sig in signals:
@@ -103,17 +139,12 @@ def main():
                 paper_engine.open_position_for_signal(sig, entry_price)
 
                 route = route_signal(sig, cfg)
-                if route.mode == "short":
-                    text = format_short_alert(sig)
-                elif route.mode == "deep_dive":
-                    text = format_deep_dive_alert(sig)
-                else:
-                    text = format_medium_alert(sig)
+                text = _FORMATTERS.get(route.mode, format_medium_alert)(sig)
 
-                send_alert(route, text, cfg)
+                dispatch_alert(route, text, cfg)
 
-            now_monotonic = time.monotonic()
-            if now_monotonic - last_heartbeat_log >= heartbeat_interval_seconds:
+            if heartbeat_due.is_set():
+                heartbeat_due.clear()
                 LOGGER.info(
                     (
                         "[HEARTBEAT] Bot alive | Universe Size: %s | Poll Interval: %.2fs | "
@@ -125,12 +156,17 @@ def main():
                     hb.signals_generated,
                 )
                 LOGGER.debug(hb.snapshot())
-                last_heartbeat_log = now_monotonic
 
-            # TODO: periodically update paper positions with latest prices
+            if paper_update_due.is_set():
+                paper_update_due.clear()
+                for pos in paper_engine.update_positions_bulk(latest_prices, now):
+                    paper_logger.log_position(pos)
+
             # TODO: periodically send heartbeat snapshot
     except Exception as exc:  # pragma: no cover - runtime guard
         LOGGER.exception("Fatal error in live loop: %s", exc)
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
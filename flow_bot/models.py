@@ -13,10 +13,14 @@ from datetime import date, datetime
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FlowEvent:
     """Normalized options flow event pulled from a provider.
 
+    Events are immutable once normalized; use ``dataclasses.replace`` to derive
+    a modified copy. ``raw`` is excluded from equality/hashing so identical
+    prints compare equal regardless of payload shape.
+
     Attributes:
         ticker: Underlying equity/ETF ticker.
         call_put: Contract type ("CALL" or "PUT").
@@ -41,6 +45,9 @@ class FlowEvent:
         is_aggressive: True if executed at/above ask for buys or at/below bid for sells.
         is_multi_leg: True if part of a multi-leg/complex order.
         raw: Raw payload for debugging/backfill.
+        call_put_u/side_u: Upper-cased contract type and order side, derived
+            once at construction with the strategies' fallbacks applied
+            (``raw["call_put"]`` then "CALL"; ``action`` then "BUY").
     """
 
     ticker: str
@@ -66,10 +73,18 @@ class FlowEvent:
     delta: Optional[float] = None
     bid: Optional[float] = None
     ask: Optional[float] = None
-    raw: dict = field(default_factory=dict)
+    raw: dict = field(default_factory=dict, compare=False)
+    call_put_u: str = field(init=False, repr=False, compare=False)
+    side_u: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        call_put = self.call_put or self.raw.get("call_put") or "CALL"
+        side = self.side or self.action or "BUY"
+        object.__setattr__(self, "call_put_u", call_put.upper())
+        object.__setattr__(self, "side_u", side.upper())
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """Derived trading idea produced by a strategy.
 
@@ -110,7 +125,7 @@ class Signal:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperPosition:
     """Simple in-memory paper trade position used for simulation/testing."""
 
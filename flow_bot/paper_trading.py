@@ -1,28 +1,54 @@
 """Simple in-memory paper trading engine."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import functools
+from datetime import datetime
 from typing import Dict, List
 from uuid import uuid4
 
 from .models import PaperPosition, Signal
 
 
+# (tp_pct, sl_pct, max_hold_seconds) by signal-kind prefix; other kinds
+# (e.g. DAY_TRADE) use the day-trade defaults.
+_EXIT_DEFAULTS = (
+    ("SCALP", (2.0, -1.0, 30 * 60)),
+    ("SWING", (15.0, -5.0, 7 * 24 * 60 * 60)),
+)
+_DAY_EXIT_DEFAULTS = (5.0, -2.0, 6 * 60 * 60)
+
+
+@functools.lru_cache(maxsize=32)
+def _defaults_for_kind(kind: str) -> tuple[float, float, int]:
+    """Resolve exit defaults for ``kind``; kinds come from a small closed set."""
+
+    kind_upper = kind.upper()
+    for prefix, defaults in _EXIT_DEFAULTS:
+        if kind_upper.startswith(prefix):
+            return defaults
+    return _DAY_EXIT_DEFAULTS
+
+
+def _epoch_ns(ts: datetime) -> int:
+    """Integer nanoseconds since the epoch for ``ts`` (naive values as local time)."""
+
+    return int(ts.timestamp()) * 1_000_000_000 + ts.microsecond * 1_000
+
+
 class PaperTradingEngine:
     def __init__(self, config: dict):
         self.cfg = config
         self.positions: Dict[str, PaperPosition] = {}
-
-    def _defaults_for_kind(self, kind: str) -> tuple[float, float, int]:
-        kind_upper = kind.upper()
-        if kind_upper.startswith("SCALP"):
-            return 2.0, -1.0, 30 * 60
-        if kind_upper.startswith("SWING"):
-            return 15.0, -5.0, 7 * 24 * 60 * 60
-        return 5.0, -2.0, 6 * 60 * 60
+        # Open positions grouped by ticker so price updates only visit that ticker.
+        self._open_by_ticker: Dict[str, Dict[str, PaperPosition]] = {}
+        # Exit levels precomputed at open, keyed by position id:
+        # (sign, tp_level, sl_level, deadline_ns). Prices are multiplied by
+        # ``sign`` (+1 call, -1 put) so one comparison direction serves both;
+        # the timeout deadline is an integer epoch in nanoseconds.
+        self._exits: Dict[str, tuple[float, float, float, int]] = {}
 
     def open_position_for_signal(self, signal: Signal, underlying_price: float) -> PaperPosition:
-        tp, sl, hold_seconds = self._defaults_for_kind(signal.kind)
+        tp, sl, hold_seconds = _defaults_for_kind(signal.kind)
         pos = PaperPosition(
             id=str(uuid4()),
             ticker=signal.ticker,
@@ -35,23 +61,36 @@ class PaperTradingEngine:
             max_hold_seconds=hold_seconds,
         )
         self.positions[pos.id] = pos
+        self._open_by_ticker.setdefault(pos.ticker, {})[pos.id] = pos
+        sign = -1.0 if pos.side == "LONG_PUT" else 1.0
+        entry = sign * pos.entry_price
+        self._exits[pos.id] = (
+            sign,
+            entry * (1.0 + sign * pos.tp_pct / 100.0),
+            entry * (1.0 - sign * pos.sl_pct / 100.0),
+            _epoch_ns(pos.opened_at) + pos.max_hold_seconds * 1_000_000_000,
+        )
         return pos
 
     def update_positions(self, ticker: str, now: datetime, current_price: float) -> List[PaperPosition]:
         closed: List[PaperPosition] = []
-        for pos in list(self.positions.values()):
-            if pos.ticker != ticker or pos.closed_at is not None:
-                continue
+        open_for_ticker = self._open_by_ticker.get(ticker)
+        if not open_for_ticker:
+            return closed
 
-            pct_change = (current_price - pos.entry_price) / pos.entry_price * 100.0
-            if pos.side == "LONG_PUT":
-                pct_change *= -1
+        exits = self._exits
+        now_ns = _epoch_ns(now)
+        for pos in list(open_for_ticker.values()):
+            if pos.closed_at is not None:
+                continue
 
-            if pct_change >= pos.tp_pct:
+            sign, tp_level, sl_level, deadline_ns = exits[pos.id]
+            level = sign * current_price
+            if level >= tp_level:
                 pos.outcome = "TP"
-            elif pct_change <= -pos.sl_pct:
+            elif level <= sl_level:
                 pos.outcome = "SL"
-            elif (now - pos.opened_at).total_seconds() >= pos.max_hold_seconds:
+            elif now_ns >= deadline_ns:
                 pos.outcome = "TIMEOUT"
 
             if pos.outcome:
@@ -59,5 +98,22 @@ class PaperTradingEngine:
                 pos.exit_price = current_price
                 closed.append(pos)
                 del self.positions[pos.id]
+                del open_for_ticker[pos.id]
+                del exits[pos.id]
+
+        if not open_for_ticker:
+            del self._open_by_ticker[ticker]
 
         return closed
+
+    def update_positions_bulk(
+        self, prices: Dict[str, float], now: datetime
+    ) -> List[PaperPosition]:
+        """Mark every ticker with open positions against ``prices`` in one sweep."""
+
+        closed: List[PaperPosition] = []
+        for ticker in list(self._open_by_ticker):
+            price = prices.get(ticker)
+            if price:
+                closed.extend(self.update_positions(ticker, now, price))
+        return closed
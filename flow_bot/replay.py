@@ -1,8 +1,11 @@
 """Historical replay/backtest helpers."""
 from __future__ import annotations
 
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 
 from .flow_client import FlowClient
 from .logging_utils import SignalLogger
@@ -10,14 +13,61 @@ from .models import FlowEvent, Signal
 from .signal_engine import SignalEngine
 
 
-def replay_period(start: datetime, end: datetime, config: dict):
-    client = FlowClient(config)
+def _replay_events(config: dict, events: List[FlowEvent]) -> List[Signal]:
+    """Run ``events`` (already in time order) through a fresh SignalEngine."""
+
     engine = SignalEngine(config)
-    logger = SignalLogger("signals_replay_log.csv")
+    signals: List[Signal] = []
+    for event in events:
+        signals.extend(engine.process_event(event, event.event_time))
+    return signals
+
+
+def _partition_by_ticker(events: List[FlowEvent], buckets: int) -> List[List[FlowEvent]]:
+    """Split time-ordered events into ``buckets`` lists, keeping each ticker whole."""
+
+    by_ticker: Dict[str, List[FlowEvent]] = defaultdict(list)
+    for event in events:
+        by_ticker[event.ticker].append(event)
+
+    # Largest tickers first onto the lightest bucket keeps workers balanced.
+    parts: List[List[FlowEvent]] = [[] for _ in range(buckets)]
+    for ticker_events in sorted(by_ticker.values(), key=len, reverse=True):
+        min(parts, key=len).extend(ticker_events)
+    return [part for part in parts if part]
 
-    events: List[FlowEvent] = client.fetch_historical_flow(start, end)
 
-    for event in sorted(events, key=lambda e: e.event_time):
-        signals = engine.process_event(event, event.event_time)
-        for sig in signals:
-            logger.log_signal(sig)
+def replay_period(start: datetime, end: datetime, config: dict, workers: Optional[int] = None):
+    """Replay historical flow through the strategies and log resulting signals.
+
+    Strategy state is per ticker, so events are partitioned by ticker across
+    ``workers`` processes (``replay.workers`` in config, default CPU count).
+    Signals are merged back into chronological order before logging.
+    """
+
+    client = FlowClient(config)
+
+    events: List[FlowEvent] = sorted(
+        client.fetch_historical_flow(start, end), key=lambda e: e.event_time
+    )
+    client.close()
+    if workers is None:
+        workers = int((config.get("replay") or {}).get("workers") or os.cpu_count() or 1)
+
+    parts = _partition_by_ticker(events, max(workers, 1))
+    if len(parts) <= 1:
+        signals = _replay_events(config, events)
+    else:
+        with ProcessPoolExecutor(max_workers=len(parts)) as pool:
+            results = pool.map(_replay_events, [config] * len(parts), parts)
+            signals = sorted(
+                (sig for part_signals in results for sig in part_signals),
+                key=lambda s: s.created_at,
+            )
+
+    # Opened only after the worker pool is gone so forked children never
+    # inherit the logger's writer thread, queue or file handle.
+    logger = SignalLogger("signals_replay_log.csv")
+    for sig in signals:
+        logger.log_signal(sig)
+    logger.close()
@@ -1,25 +1,48 @@
 """Routing utilities for alerts."""
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
+import queue
+import threading
+import time
 from dataclasses import dataclass
+from typing import Dict, Optional
 
 from .models import Signal
 from .shared import send_alert as send_telegram_alert
 
 LOGGER = logging.getLogger(__name__)
 
+# Bounded alert pipeline: the live loop only enqueues, a few sender threads
+# drain the queue. When full, new alerts are dropped rather than stalling
+# ingestion.
+_ALERT_QUEUE_SIZE = 512
+_ALERT_WORKERS = 4
+_ALERT_QUEUE: "queue.Queue[tuple[AlertRoute, str, dict]]" = queue.Queue(maxsize=_ALERT_QUEUE_SIZE)
+_workers_lock = threading.Lock()
+_workers_started = False
 
-@dataclass
+# Per-channel monotonic deadlines set by Telegram 429 responses.
+_channel_blocked_until: Dict[str, float] = {}
+
+
+@dataclass(frozen=True)
 class AlertRoute:
-    """Alert destination info."""
+    """Alert destination info (immutable; instances are shared per signal kind)."""
 
     mode: str  # "short" | "medium" | "deep_dive"
     channel: str  # e.g. "telegram_scalps"
 
 
 def route_signal(signal: Signal, config: dict) -> AlertRoute:
-    kind = signal.kind.upper()
+    return _route_for_kind(signal.kind)
+
+
+@functools.lru_cache(maxsize=32)
+def _route_for_kind(kind: str) -> AlertRoute:
+    kind = kind.upper()
     if kind.startswith("SCALP"):
         return AlertRoute(mode="short", channel="telegram_scalps")
     if kind.startswith("SWING"):
@@ -27,15 +50,79 @@ def route_signal(signal: Signal, config: dict) -> AlertRoute:
     return AlertRoute(mode="medium", channel="telegram_main")
 
 
-def send_alert(route: AlertRoute, text: str, config: dict) -> None:
+def send_alert(route: AlertRoute, text: str, config: dict) -> Optional[float]:
     """Send alert text to a configured channel via Telegram.
 
     The ``config`` argument is retained for backward compatibility with existing
     call sites, but channel resolution is handled inside :mod:`flow_bot.shared`
-    using environment variables.
+    using environment variables. Returns the rate-limit back-off in seconds
+    when Telegram asks the channel to slow down, else ``None``.
     """
 
     try:
-        send_telegram_alert(text, channel=route.channel)
+        return send_telegram_alert(text, channel=route.channel)
     except Exception as exc:  # pragma: no cover - defensive logging
         LOGGER.exception("Failed to dispatch alert for %s: %s", route.channel, exc)
+        return None
+
+
+def dispatch_alert(route: AlertRoute, text: str, config: dict) -> None:
+    """Queue an alert for background delivery and return immediately.
+
+    Alerts are dropped with a warning when the queue is full so a Telegram
+    outage cannot back up flow ingestion.
+    """
+
+    _ensure_workers()
+    try:
+        _ALERT_QUEUE.put_nowait((route, text, config))
+    except queue.Full:
+        LOGGER.warning(
+            "[ALERT] Alert queue full (%d pending); dropping alert for %s",
+            _ALERT_QUEUE_SIZE,
+            route.channel,
+        )
+
+
+def _ensure_workers() -> None:
+    global _workers_started
+    if _workers_started:
+        return
+    with _workers_lock:
+        if _workers_started:
+            return
+        for idx in range(_ALERT_WORKERS):
+            threading.Thread(target=_alert_worker, name=f"alert-{idx}", daemon=True).start()
+        atexit.register(_drain_alerts)
+        _workers_started = True
+
+
+def _alert_worker() -> None:
+    while True:
+        route, text, config = _ALERT_QUEUE.get()
+        try:
+            _wait_for_channel(route.channel)
+            retry_after = send_alert(route, text, config)
+            if retry_after:
+                # Pause the whole channel, then retry this alert once.
+                _channel_blocked_until[route.channel] = time.monotonic() + retry_after
+                _wait_for_channel(route.channel)
+                send_alert(route, text, config)
+        except Exception:  # pragma: no cover - defensive logging
+            LOGGER.exception("Alert worker failed for %s", route.channel)
+        finally:
+            _ALERT_QUEUE.task_done()
+
+
+def _wait_for_channel(channel: str) -> None:
+    delay = _channel_blocked_until.get(channel, 0.0) - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def _drain_alerts(timeout: float = 10.0) -> None:
+    """Give queued alerts a bounded chance to send before the process exits."""
+
+    deadline = time.monotonic() + timeout
+    while _ALERT_QUEUE.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
@@ -1,59 +1,112 @@
 """Shared scoring helpers for signals."""
 from __future__ import annotations
 
-from typing import List, Tuple
+import functools
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from .config import ModeCfg, mode_cfg_from_dict
 from .models import FlowEvent
 
+# Bit i of a score mask records that rule i fired; _MASK_LABELS[i] holds the
+# (tags, rules) it contributes, in the order score_signal has always emitted.
+_SIZE = 1 << 0
+_SWEEP = 1 << 1
+_AGGRESSIVE = 1 << 2
+_VOL_OI = 1 << 3
+_TREND = 1 << 4
+_LEVEL = 1 << 5
 
-def score_signal(event: FlowEvent, context: dict, mode_cfg: dict) -> tuple[float, list[str], list[str]]:
-    """
-    Score a flow event given contextual information.
+_MASK_LABELS: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (("SIZE", "SIZE_OK"), ("notional>=min_notional", "size_ok")),
+    (("SWEEP",), ("is_sweep",)),
+    (("AGGRESSIVE",), ("is_aggressive",)),
+    (("VOL>OI",), ("volume>=2x_oi",)),
+    (("TREND_CONFIRMED",), ("trend_aligned",)),
+    (("LEVEL_BREAK",), ("breaking_level",)),
+)
 
-    Returns (strength, tags, rules_triggered).
+
+def score_signal_mask(
+    event: FlowEvent,
+    context: dict,
+    mode_cfg: Union[ModeCfg, Dict[str, Any]],
+    trend_aligned: Optional[bool] = None,
+) -> tuple[float, int]:
     """
-    score = 0.0
-    tags: list[str] = []
-    rules: list[str] = []
+    Score a flow event without building tag/rule lists.
 
-    min_notional = mode_cfg.get("min_notional")
-    if min_notional is None:
-        min_notional = mode_cfg.get("min_premium", 0)
+    ``mode_cfg`` may also be a plain mode-config dict, as accepted before
+    :class:`ModeCfg` existed; it is converted with :func:`mode_cfg_from_dict`.
+    ``trend_aligned`` overrides ``context["trend_aligned"]`` so strategies can
+    score their own alignment without copying the shared context first.
 
-    if event.notional >= min_notional:
-        score += 2
-        tags.append("SIZE")
-        rules.append("notional>=min_notional")
+    Returns (strength, mask); pass the mask to :func:`decode_score_mask` once
+    the strength clears the strategy's threshold.
+    """
+    if not isinstance(mode_cfg, ModeCfg):
+        mode_cfg = mode_cfg_from_dict(mode_cfg)
 
-    if event.notional >= min_notional:
-        score += 2
-        tags.append("SIZE_OK")
-        rules.append("size_ok")
+    score = 0.0
+    mask = 0
+
+    # Size carries double weight (historically two identical checks worth +2
+    # each); it decodes to both SIZE/SIZE_OK for alert and log consumers.
+    if event.notional >= mode_cfg.score_min_notional:
+        score += 4
+        mask |= _SIZE
 
     if event.is_sweep:
         score += 2
-        tags.append("SWEEP")
-        rules.append("is_sweep")
+        mask |= _SWEEP
 
     if event.is_aggressive:
         score += 2
-        tags.append("AGGRESSIVE")
-        rules.append("is_aggressive")
+        mask |= _AGGRESSIVE
 
     if event.volume >= 2 * max(event.open_interest, 1):
         score += 2
-        tags.append("VOL>OI")
-        rules.append("volume>=2x_oi")
+        mask |= _VOL_OI
 
-    if context.get("trend_aligned"):
+    if trend_aligned is None:
+        trend_aligned = context.get("trend_aligned")
+    if trend_aligned:
         score += 2
-        tags.append("TREND_CONFIRMED")
-        rules.append("trend_aligned")
+        mask |= _TREND
 
     if context.get("breaking_level"):
         score += 1
-        tags.append("LEVEL_BREAK")
-        rules.append("breaking_level")
+        mask |= _LEVEL
+
+    return min(score, 10.0), mask
 
-    strength = min(score, 10.0)
+
+@functools.lru_cache(maxsize=1 << len(_MASK_LABELS))
+def _labels_for_mask(mask: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    tags: List[str] = []
+    rules: List[str] = []
+    for bit, (bit_tags, bit_rules) in enumerate(_MASK_LABELS):
+        if mask >> bit & 1:
+            tags.extend(bit_tags)
+            rules.extend(bit_rules)
+    return tuple(tags), tuple(rules)
+
+
+def decode_score_mask(mask: int) -> tuple[list[str], list[str]]:
+    """Expand a mask from :func:`score_signal_mask` into fresh (tags, rules) lists."""
+    tags, rules = _labels_for_mask(mask)
+    return list(tags), list(rules)
+
+
+def score_signal(
+    event: FlowEvent, context: dict, mode_cfg: Union[ModeCfg, Dict[str, Any]]
+) -> tuple[float, list[str], list[str]]:
+    """
+    Score a flow event given contextual information.
+
+    ``mode_cfg`` is a :class:`ModeCfg` or a plain mode-config dict.
+
+    Returns (strength, tags, rules_triggered).
+    """
+    strength, mask = score_signal_mask(event, context, mode_cfg)
+    tags, rules = decode_score_mask(mask)
     return strength, tags, rules
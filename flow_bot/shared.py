@@ -7,11 +7,20 @@ webhooks or chat IDs.
 """
 from __future__ import annotations
 
+import json
 import logging
 import os
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
 
 from .config import load_config
 
@@ -25,24 +34,89 @@ CONFIG = load_config()
 # Telegram Bot token sourced from the environment.
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 
+# sendMessage endpoint, built once since the token is fixed for the process.
+_SEND_MESSAGE_URL = (
+    f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage" if TELEGRAM_BOT_TOKEN else None
+)
+
 # Logical channel keys -> environment variable names (e.g., TELEGRAM_CHAT_ID_ALERTS)
 ROUTING_CHANNELS = CONFIG.get("routing", {}).get("channels", {})
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-def _get_telegram_chat_id(channel_key: str) -> Optional[str]:
-    """Resolve the Telegram chat_id for a logical channel key.
 
-    The config maps logical keys (``telegram_scalps``, ``telegram_swings``,
-    ``telegram_main``) to an environment variable name. By default all of these
-    point to ``TELEGRAM_CHAT_ID_ALERTS`` so every alert goes to the same chat.
-    """
+def _dumps(payload: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON, preferring orjson when installed."""
+
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
+# Keep-alive session to api.telegram.org shared by the alert sender threads;
+# built on first send so importing this module opens no connections.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                # Retry only failures where Telegram cannot have accepted the
+                # message (connect errors, 502/503); read timeouts are not
+                # retried so an alert is never posted twice. 429s are left to
+                # the caller, which pauses the channel.
+                retry = Retry(
+                    total=2,
+                    read=0,
+                    backoff_factor=0.2,
+                    status_forcelist=(502, 503),
+                    allowed_methods=frozenset(["POST"]),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+                session.mount("https://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+# channel key -> (env var name, chat_id), filled once a channel resolves so
+# alerts skip the environment lookup; see :func:`reload_chat_ids`.
+_CHAT_IDS: Dict[str, Tuple[str, str]] = {}
+
+
+def _resolve_chat_id(channel_key: str) -> Tuple[str, Optional[str]]:
     env_var_name = ROUTING_CHANNELS.get(channel_key)
     if env_var_name is None:
         # Optional fallback: allow using the channel key itself as an env var name
         env_var_name = channel_key.upper()
 
     chat_id = os.getenv(env_var_name)
+    if not chat_id:
+        # Misses are not cached so a chat id exported after startup is picked up.
+        return env_var_name, None
+    resolved = _CHAT_IDS[channel_key] = (env_var_name, chat_id)
+    return resolved
+
+
+def reload_chat_ids() -> None:
+    """Forget cached chat ids so the next alert re-reads the environment."""
+
+    _CHAT_IDS.clear()
+
+
+def _get_telegram_chat_id(channel_key: str) -> Optional[str]:
+    """Resolve the Telegram chat_id for a logical channel key.
+
+    The config maps logical keys (``telegram_scalps``, ``telegram_swings``,
+    ``telegram_main``) to an environment variable name. By default all of these
+    point to ``TELEGRAM_CHAT_ID_ALERTS`` so every alert goes to the same chat.
+    """
+
+    env_var_name, chat_id = _CHAT_IDS.get(channel_key) or _resolve_chat_id(channel_key)
     if not chat_id:
         logger.error(
             "No Telegram chat_id found for channel '%s' (env var '%s' is not set)",
@@ -54,33 +128,56 @@ def _get_telegram_chat_id(channel_key: str) -> Optional[str]:
     return chat_id
 
 
-def send_alert(message: str, channel: str = "telegram_main") -> None:
+def _retry_after_seconds(resp: requests.Response) -> float:
+    """Extract Telegram's flood-control delay from a 429 response."""
+
+    try:
+        retry_after = (resp.json().get("parameters") or {}).get("retry_after")
+    except Exception:
+        retry_after = None
+    if retry_after is None:
+        retry_after = resp.headers.get("Retry-After")
+    try:
+        return max(float(retry_after), 1.0)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def send_alert(message: str, channel: str = "telegram_main") -> Optional[float]:
     """Send an alert message to Telegram using the Bot API.
 
     All logical channels ultimately resolve to the same chat_id via
-    ``TELEGRAM_CHAT_ID_ALERTS``. Failures are logged and do not raise.
+    ``TELEGRAM_CHAT_ID_ALERTS``. Failures are logged and do not raise. When
+    Telegram rate limits the chat (HTTP 429), the requested back-off in
+    seconds is returned so callers can pause that channel; otherwise ``None``.
     """
 
-    if not TELEGRAM_BOT_TOKEN:
+    if _SEND_MESSAGE_URL is None:
         logger.error("[ALERT] TELEGRAM_BOT_TOKEN is not set; cannot send Telegram alerts.")
-        return
+        return None
 
     chat_id = _get_telegram_chat_id(channel)
     if not chat_id:
-        return
+        return None
 
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
     payload = {
         "chat_id": chat_id,
         "text": message,
-        "parse_mode": "Markdown",
         "disable_web_page_preview": True,
     }
 
     logger.info("[ALERT] Sending Telegram alert | Channel: %s", channel)
     resp = None
     try:
-        resp = requests.post(url, json=payload, timeout=5)
+        resp = _get_session().post(_SEND_MESSAGE_URL, data=_dumps(payload), headers=_JSON_HEADERS, timeout=5)
+        if resp.status_code == 429:
+            retry_after = _retry_after_seconds(resp)
+            logger.warning(
+                "[ALERT] Telegram rate limited | Channel: %s | Retry after: %.0fs",
+                channel,
+                retry_after,
+            )
+            return retry_after
         resp.raise_for_status()
         logger.info("[ALERT] Telegram delivered successfully | Channel: %s", channel)
     except Exception as exc:  # pragma: no cover - network path
@@ -91,4 +188,5 @@ def send_alert(message: str, channel: str = "telegram_main") -> None:
             status,
             exc,
         )
+    return None
 
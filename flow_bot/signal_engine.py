@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+from .config import ModeCfg, get_ticker_mode_cfg
 from .context_engine import ContextEngine
 from .models import FlowEvent, Signal
 from .strategies.base import Strategy
@@ -11,9 +12,15 @@ from .strategies.day_trend import DayTrendStrategy
 from .strategies.scalp_momentum import ScalpMomentumStrategy
 from .strategies.swing_accumulation import SwingAccumulationStrategy
 
+Evaluator = Callable[..., Optional[Signal]]
+
 
 class SignalEngine:
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, universe: Optional[Iterable[str]] = None):
+        """Build the engine; ``universe`` pre-resolves per-ticker thresholds.
+
+        Tickers outside ``universe`` are still resolved on their first event.
+        """
         self.cfg = config
         self.context_engine = ContextEngine(config)
         self.strategies: List[Strategy] = [
@@ -21,15 +28,47 @@ class SignalEngine:
             DayTrendStrategy(),
             SwingAccumulationStrategy(),
         ]
+        # Bound evaluate methods, bound once so the per-event loop skips the
+        # attribute lookup on each strategy instance.
+        self._evaluators: Tuple[Tuple[str, Evaluator], ...] = tuple(
+            (strategy.mode, strategy.evaluate) for strategy in self.strategies
+        )
+        # ticker -> ((evaluate, resolved ModeCfg), ...) in strategy order; config
+        # is static for the life of the engine so each ticker is resolved once.
+        self._plans: Dict[str, Tuple[Tuple[Evaluator, ModeCfg], ...]] = {}
+        for ticker in universe or ():
+            self._plan_for(ticker)
+
+    def _plan_for(self, ticker: str) -> Tuple[Tuple[Evaluator, ModeCfg], ...]:
+        plan = self._plans.get(ticker)
+        if plan is None:
+            plan = self._plans[ticker] = tuple(
+                (evaluate, get_ticker_mode_cfg(self.cfg, ticker, mode))
+                for mode, evaluate in self._evaluators
+            )
+        return plan
 
     def process_event(self, event: FlowEvent, now: datetime) -> list[Signal]:
         """Returns a list of Signals generated for this event."""
         signals: list[Signal] = []
+        dte = (event.expiry - event.event_time.date()).days
+
+        # Shared cheap gates every strategy applies first; most prints fail
+        # them for all modes, so context is only built when one survives.
+        candidates = [
+            (evaluate, mode_cfg)
+            for evaluate, mode_cfg in self._plan_for(event.ticker)
+            if dte <= mode_cfg.max_dte and event.notional >= mode_cfg.min_notional
+        ]
+        if not candidates:
+            return signals
+
         market_regime = self.context_engine.get_market_regime(now)
         ticker_context = self.context_engine.get_ticker_context(event)
+        otm_pct = abs(event.strike - event.underlying_price) / max(event.underlying_price, 1) * 100
 
-        for strategy in self.strategies:
-            sig = strategy.evaluate(event, ticker_context, market_regime, self.cfg)
+        for evaluate, mode_cfg in candidates:
+            sig = evaluate(event, ticker_context, market_regime, self.cfg, mode_cfg, dte, otm_pct)
             if sig is not None:
                 signals.append(sig)
 
@@ -1,18 +1,46 @@
 """Strategy interface for producing signals from flow events."""
 from __future__ import annotations
 
+import itertools
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from ..config import ModeCfg
 from ..models import FlowEvent, Signal
 
+_SIGNAL_SEQ = itertools.count(1)
+
+
+def next_signal_id(event: FlowEvent) -> str:
+    """Return a process-unique signal id: ``<ticker>-<seq>-<event epoch seconds>``.
+
+    Much cheaper than ``str(uuid4())``; the ticker prefix keeps ids distinct
+    across replay worker processes, which each start their own sequence.
+    """
+
+    return f"{event.ticker}-{next(_SIGNAL_SEQ)}-{int(event.event_time.timestamp())}"
+
 
 class Strategy(ABC):
     name: str = "base"
+    # Config section the strategy reads its thresholds from.
+    mode: str = "base"
 
     @abstractmethod
     def evaluate(
-        self, event: FlowEvent, context: dict, market_regime: dict, global_cfg: dict
+        self,
+        event: FlowEvent,
+        context: dict,
+        market_regime: dict,
+        global_cfg: dict,
+        mode_cfg: Optional[ModeCfg] = None,
+        dte: Optional[int] = None,
+        otm_pct: Optional[float] = None,
     ) -> Optional[Signal]:
-        """Inspect a FlowEvent and its context, return a Signal or None."""
+        """Inspect a FlowEvent and its context, return a Signal or None.
+
+        ``mode_cfg`` is the pre-resolved config for ``(event.ticker, self.mode)``,
+        ``dte`` the event's days to expiry and ``otm_pct`` the strike's distance
+        from the underlying in percent; each is computed here when omitted.
+        """
         raise NotImplementedError
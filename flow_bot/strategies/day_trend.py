@@ -3,34 +3,44 @@ from __future__ import annotations
 
 from datetime import timedelta
 from typing import Optional
-from uuid import uuid4
 
-from ..config import get_ticker_config
+from ..config import ModeCfg, get_ticker_mode_cfg
 from ..models import FlowEvent, Signal
-from ..scoring import score_signal
-from .base import Strategy
+from ..scoring import decode_score_mask, score_signal_mask
+from .base import Strategy, next_signal_id
 
 
 class DayTrendStrategy(Strategy):
     name = "day_trend"
+    mode = "day_trade"
 
     def evaluate(
-        self, event: FlowEvent, context: dict, market_regime: dict, global_cfg: dict
+        self,
+        event: FlowEvent,
+        context: dict,
+        market_regime: dict,
+        global_cfg: dict,
+        mode_cfg: Optional[ModeCfg] = None,
+        dte: Optional[int] = None,
+        otm_pct: Optional[float] = None,
     ) -> Optional[Signal]:
-        mode_cfg = get_ticker_config(global_cfg, event.ticker, "day_trade")
+        if mode_cfg is None:
+            mode_cfg = get_ticker_mode_cfg(global_cfg, event.ticker, self.mode)
 
-        dte = (event.expiry - event.event_time.date()).days
-        if dte > mode_cfg.get("max_dte", 10):
+        if dte is None:
+            dte = (event.expiry - event.event_time.date()).days
+        if dte > mode_cfg.max_dte:
             return None
-        if event.notional < mode_cfg.get("min_notional", 0):
+        if event.notional < mode_cfg.min_notional:
             return None
 
-        otm_pct = abs(event.strike - event.underlying_price) / max(event.underlying_price, 1) * 100
-        if otm_pct > mode_cfg.get("max_otm_pct", 100):
+        if otm_pct is None:
+            otm_pct = abs(event.strike - event.underlying_price) / max(event.underlying_price, 1) * 100
+        if otm_pct > mode_cfg.max_otm_pct:
             return None
 
-        call_put = (event.call_put or event.raw.get("call_put") or "CALL").upper()
-        order_side = (event.side or event.action or "BUY").upper()
+        call_put = event.call_put_u
+        order_side = event.side_u
 
         trend_15m_up = bool(context.get("trend_15m_up"))
         if call_put == "CALL":
@@ -46,18 +56,20 @@ class DayTrendStrategy(Strategy):
 
         # Relative volume guard if provided
         rvol = context.get("rvol")
-        if rvol is not None and rvol < mode_cfg.get("min_rvol", 0):
+        if rvol is not None and rvol < mode_cfg.min_rvol:
             return None
 
         if not breaking_level:
             return None
 
-        enriched_context = dict(context)
-        enriched_context["trend_aligned"] = trend_aligned and breaking_level
+        trend_aligned = trend_aligned and breaking_level
 
-        strength, tags, rules = score_signal(event, enriched_context, mode_cfg)
-        if strength < mode_cfg.get("min_strength", 0):
+        strength, score_mask = score_signal_mask(event, context, mode_cfg, trend_aligned)
+        if strength < mode_cfg.min_strength:
             return None
+        tags, rules = decode_score_mask(score_mask)
+        enriched_context = dict(context)
+        enriched_context["trend_aligned"] = trend_aligned
 
         tags.append("BREAKOUT")
         if event.is_sweep:
@@ -75,11 +87,13 @@ class DayTrendStrategy(Strategy):
             "underlying_price": event.underlying_price,
         }
 
-        time_min = int(mode_cfg.get("time_horizon_min", 30))
-        time_max = int(mode_cfg.get("time_horizon_max", 180))
+        enriched_context["rules_triggered"] = rules
+        enriched_context["market_regime"] = market_regime
+        enriched_context["price_info"] = price_info
+        enriched_context["mode"] = "day"
 
         return Signal(
-            id=str(uuid4()),
+            id=next_signal_id(event),
             ticker=event.ticker,
             kind="DAY_TRADE",
             direction=direction,
@@ -87,17 +101,11 @@ class DayTrendStrategy(Strategy):
             strength=strength,
             tags=tags,
             flow_events=[event],
-            context={
-                **enriched_context,
-                "rules_triggered": rules,
-                "market_regime": market_regime,
-                "price_info": price_info,
-                "mode": "day",
-            },
+            context=enriched_context,
             created_at=event.event_time,
             experiment_id=global_cfg.get("experiment_id", "unknown"),
-            time_horizon_min=time_min,
-            time_horizon_max=time_max,
-            tp_pct=mode_cfg.get("tp_pct"),
-            sl_pct=mode_cfg.get("sl_pct"),
+            time_horizon_min=mode_cfg.time_horizon_min,
+            time_horizon_max=mode_cfg.time_horizon_max,
+            tp_pct=mode_cfg.tp_pct,
+            sl_pct=mode_cfg.sl_pct,
         )
@@ -1,40 +1,51 @@
 """Swing accumulation strategy with repeat buying detection."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Dict, Optional, Tuple
-from uuid import uuid4
+from collections import defaultdict
+from datetime import date
+from typing import DefaultDict, Optional, Tuple
 
-from ..config import get_ticker_config
+from ..config import ModeCfg, get_ticker_mode_cfg
 from ..models import FlowEvent, Signal
-from ..scoring import score_signal
-from .base import Strategy
+from ..scoring import decode_score_mask, score_signal_mask
+from .base import Strategy, next_signal_id
 
 
 class SwingAccumulationStrategy(Strategy):
     name = "swing_accumulation"
+    mode = "swing"
 
     def __init__(self):
         # Track cumulative notional by chain to simulate persistent buying
-        self.chain_totals: Dict[Tuple[str, float, datetime, str], float] = {}
+        self.chain_totals: DefaultDict[Tuple[str, float, date, str], float] = defaultdict(float)
 
     def evaluate(
-        self, event: FlowEvent, context: dict, market_regime: dict, global_cfg: dict
+        self,
+        event: FlowEvent,
+        context: dict,
+        market_regime: dict,
+        global_cfg: dict,
+        mode_cfg: Optional[ModeCfg] = None,
+        dte: Optional[int] = None,
+        otm_pct: Optional[float] = None,
     ) -> Optional[Signal]:
-        mode_cfg = get_ticker_config(global_cfg, event.ticker, "swing")
+        if mode_cfg is None:
+            mode_cfg = get_ticker_mode_cfg(global_cfg, event.ticker, self.mode)
 
-        dte = (event.expiry - event.event_time.date()).days
-        if dte < mode_cfg.get("min_dte", 0) or dte > mode_cfg.get("max_dte", 10**6):
+        if dte is None:
+            dte = (event.expiry - event.event_time.date()).days
+        if dte < mode_cfg.min_dte or dte > mode_cfg.max_dte:
             return None
-        if event.notional < mode_cfg.get("min_notional", 0):
+        if event.notional < mode_cfg.min_notional:
             return None
 
-        key = (event.ticker, event.strike, event.expiry, (event.call_put or event.raw.get("call_put") or "CALL"))
-        self.chain_totals[key] = self.chain_totals.get(key, 0.0) + event.notional
-        persistent_buyer = self.chain_totals[key] >= mode_cfg.get("min_notional", 0) * 3
+        key = (event.ticker, event.strike, event.expiry, event.call_put_u)
+        chain_total = self.chain_totals[key] + event.notional
+        self.chain_totals[key] = chain_total
+        persistent_buyer = chain_total >= mode_cfg.min_notional * 3
 
-        call_put = (event.call_put or event.raw.get("call_put") or "CALL").upper()
-        order_side = (event.side or event.action or "BUY").upper()
+        call_put = event.call_put_u
+        order_side = event.side_u
 
         trend_daily_up = bool(context.get("trend_daily_up"))
         if call_put == "CALL":
@@ -44,13 +55,13 @@ class SwingAccumulationStrategy(Strategy):
             trend_aligned = not trend_daily_up
             direction = "BEARISH" if order_side != "SELL" else "BULLISH"
 
+        strength, score_mask = score_signal_mask(event, context, mode_cfg, trend_aligned)
+        if strength < mode_cfg.min_strength:
+            return None
+        tags, rules = decode_score_mask(score_mask)
         enriched_context = dict(context)
         enriched_context["trend_aligned"] = trend_aligned
 
-        strength, tags, rules = score_signal(event, enriched_context, mode_cfg)
-        if strength < mode_cfg.get("min_strength", 0):
-            return None
-
         if persistent_buyer:
             tags.append("PERSISTENT_BUYER")
             rules.append("persistent_buyer")
@@ -61,21 +72,28 @@ class SwingAccumulationStrategy(Strategy):
 
         rules.append("swing_filters_passed")
 
-        otm_pct = abs(event.strike - event.underlying_price) / max(event.underlying_price, 1) * 100
+        if otm_pct is None:
+            otm_pct = abs(event.strike - event.underlying_price) / max(event.underlying_price, 1) * 100
 
         price_info = {
-            "persistent_notional": self.chain_totals[key],
+            "persistent_notional": chain_total,
             "dte": dte,
             "otm_pct": otm_pct,
             "rvol": context.get("rvol"),
             "underlying_price": event.underlying_price,
         }
 
-        days_min = int(mode_cfg.get("time_horizon_days_min", mode_cfg.get("min_dte", 2)))
-        days_max = int(mode_cfg.get("time_horizon_days_max", mode_cfg.get("max_dte", dte)))
+        days_max = mode_cfg.time_horizon_days_max
+        if days_max is None:
+            days_max = dte
+
+        enriched_context["rules_triggered"] = rules
+        enriched_context["market_regime"] = market_regime
+        enriched_context["price_info"] = price_info
+        enriched_context["mode"] = "swing"
 
         return Signal(
-            id=str(uuid4()),
+            id=next_signal_id(event),
             ticker=event.ticker,
             kind="SWING",
             direction=direction,
@@ -83,17 +101,11 @@ class SwingAccumulationStrategy(Strategy):
             strength=strength,
             tags=tags,
             flow_events=[event],
-            context={
-                **enriched_context,
-                "rules_triggered": rules,
-                "market_regime": market_regime,
-                "price_info": price_info,
-                "mode": "swing",
-            },
+            context=enriched_context,
             created_at=event.event_time,
             experiment_id=global_cfg.get("experiment_id", "unknown"),
-            time_horizon_days_min=days_min,
+            time_horizon_days_min=mode_cfg.time_horizon_days_min,
             time_horizon_days_max=days_max,
-            tp_pct=mode_cfg.get("tp_pct"),
-            sl_pct=mode_cfg.get("sl_pct"),
+            tp_pct=mode_cfg.tp_pct,
+            sl_pct=mode_cfg.sl_pct,
         )
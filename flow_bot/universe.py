@@ -7,16 +7,29 @@ Precedence:
 """
 from __future__ import annotations
 
+import functools
+import heapq
 import logging
-from typing import Dict, Iterable, List, Tuple
+import threading
+import time
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
 
 from .config import load_api_keys
 
 LOGGER = logging.getLogger(__name__)
 
-DEFAULT_FALLBACK = [
+DEFAULT_FALLBACK: Tuple[str, ...] = (
     "SPY",
     "QQQ",
     "IWM",
@@ -42,36 +55,84 @@ DEFAULT_FALLBACK = [
     "XOM",
     "CVX",
     "TSM",
-]
+)
+
+
+# Keep-alive session to the snapshot host so repeat universe resolutions skip
+# the TCP/TLS handshake; built on first use.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(["GET"]),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                # The snapshot is large, highly compressible JSON; ask for it
+                # compressed explicitly rather than relying on defaults.
+                session.headers.update(make_headers(accept_encoding=True))
+                session.headers["Accept"] = "application/json"
+                session.headers["User-Agent"] = "prime-flow-ai/universe"
+                _SESSION = session
+    return _SESSION
+
+
+# Last dynamic universe: (monotonic fetch time, cache key, tickers). Reused for
+# ``universe.cache_ttl_seconds`` so back-to-back resolutions (startup summary,
+# then the flow client) hit the snapshot endpoint once.
+_UNIVERSE_CACHE: Optional[Tuple[float, Tuple, Tuple[str, ...]]] = None
+_UNIVERSE_CACHE_LOCK = threading.Lock()
+DEFAULT_CACHE_TTL_SECONDS = 60.0
+
+
+# (url, max_tickers, trust_server_sort) -> (ETag, Last-Modified, ranked tickers)
+# from the last snapshot that carried validators.
+_SNAPSHOT_VALIDATORS: Dict[Tuple, Tuple[Optional[str], Optional[str], Tuple[str, ...]]] = {}
+
+
+def clear_universe_cache() -> None:
+    """Drop the cached dynamic universe so the next resolution refetches."""
+
+    global _UNIVERSE_CACHE
+    with _UNIVERSE_CACHE_LOCK:
+        _UNIVERSE_CACHE = None
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_api_keys() -> Dict[str, str]:
+    """Environment API keys for configs that carry none; read once per process.
+
+    Call ``_cached_api_keys.cache_clear()`` after changing the environment.
+    """
+
+    return load_api_keys()
 
 
 def _unique(seq: Iterable[str]) -> List[str]:
-    seen = set()
-    ordered: List[str] = []
-    for item in seq:
-        if item in seen:
-            continue
-        seen.add(item)
-        ordered.append(item)
-    return ordered
-
-
-def _dollar_volume(result: Dict) -> Tuple[float, float]:
-    """Return (dollar_volume, share_volume) tuple for sorting."""
-
-    day = result.get("day") or {}
-    vol = float(day.get("volume") or 0.0)
-    price = float(
-        day.get("close")
-        or day.get("prev_close")
-        or (result.get("lastTrade") or {}).get("p")
-        or (result.get("lastQuote") or {}).get("p")
-        or 0.0
-    )
-    return vol * price, vol
+    """Drop duplicates, keeping first-seen order."""
+
+    return list(dict.fromkeys(seq))
 
 
 def _try_fetch_top_volume(cfg: Dict, max_tickers: int, api_key: str) -> List[str]:
+    """Return up to ``max_tickers`` snapshot tickers ranked by dollar volume.
+
+    Tickers are already upper-cased; callers only need to de-duplicate.
+    """
+
     provider_cfg = cfg.get("provider") or {}
     base_url = provider_cfg.get("base_url", "https://api.massive.com")
     equity_snapshot_path = provider_cfg.get(
@@ -92,24 +153,93 @@ def _try_fetch_top_volume(cfg: Dict, max_tickers: int, api_key: str) -> List[str
         url,
     )
 
-    resp = requests.get(url, params=params, timeout=10)
+    trust_server_sort = bool(provider_cfg.get("trust_server_sort"))
+    # Conditional GET: replay the last snapshot's validators so an unchanged
+    # snapshot comes back as an empty 304 and skips the download and decode.
+    validator_key = (url, max_tickers, trust_server_sort)
+    previous = _SNAPSHOT_VALIDATORS.get(validator_key)
+    headers: Dict[str, str] = {}
+    if previous is not None:
+        etag, last_modified, _ = previous
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    resp = _get_session().get(url, params=params, headers=headers, timeout=(3.05, 10))
+    if resp.status_code == 304 and previous is not None:
+        LOGGER.info("[UNIVERSE] Equity snapshot not modified; reusing previous ranking")
+        return list(previous[2])
     resp.raise_for_status()
-    payload = resp.json() or {}
+    if orjson is not None:
+        payload = (orjson.loads(resp.content) if resp.content else None) or {}
+    else:
+        payload = resp.json() or {}
     results = payload.get("tickers") or []
 
-    scored: List[Tuple[str, float, float]] = []
-    for item in results:
-        ticker = (item.get("ticker") or item.get("symbol") or "").upper()
-        if not ticker:
-            continue
-        dollar_vol, share_vol = _dollar_volume(item)
-        scored.append((ticker, dollar_vol, share_vol))
+    ranked = _rank_snapshot(results, max_tickers, trust_server_sort)
 
-    scored.sort(key=lambda tup: (tup[1], tup[2]), reverse=True)
-    return [t for t, _, _ in scored[:max_tickers]]
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        _SNAPSHOT_VALIDATORS[validator_key] = (etag, last_modified, tuple(ranked))
+    else:
+        _SNAPSHOT_VALIDATORS.pop(validator_key, None)
+    return ranked
+
+
+def _rank_snapshot(results: List[Dict], max_tickers: int, trust_server_sort: bool) -> List[str]:
+    """Rank snapshot rows by dollar volume (then share volume); upper-cased tickers."""
+
+    if trust_server_sort:
+        # Provider already honours sort=day.volume&order=desc&limit=N, so the
+        # rows arrive ranked; keep their order and skip the local scoring.
+        ranked = (
+            (item.get("ticker") or item.get("symbol") or "").upper() for item in results
+        )
+        return list(islice((t for t in ranked if t), max_tickers))
 
+    def _scored() -> Iterator[Tuple[float, float, int, str]]:
+        # Dollar volume = day volume x price, with price falling back from
+        # close to prev_close, lastTrade.p, lastQuote.p. Locals are bound up
+        # front since this runs once per row of the full-market snapshot.
+        _float = float
+        for position, item in enumerate(results):
+            ticker = (item.get("ticker") or item.get("symbol") or "").upper()
+            if not ticker:
+                continue
+            # Common case: the day bar carries volume and close, so the
+            # last-trade/last-quote fallbacks are only touched on a miss.
+            day = item.get("day")
+            if day:
+                vol = _float(day.get("volume") or 0.0)
+                price = day.get("close") or day.get("prev_close")
+            else:
+                vol = 0.0
+                price = None
+            if not price:
+                last_trade = item.get("lastTrade")
+                price = last_trade and last_trade.get("p")
+                if not price:
+                    last_quote = item.get("lastQuote")
+                    price = (last_quote and last_quote.get("p")) or 0.0
+            # Rows compare naturally: dollar volume, share volume, then earlier
+            # position first, so no per-row key tuple is needed.
+            yield vol * _float(price), vol, -position, ticker
 
-def resolve_universe(cfg: Dict, *, max_tickers: int = 500) -> List[str]:
+    # nlargest keeps only max_tickers rows in its heap; the -position field
+    # breaks ties in input order, matching a stable descending sort.
+    top = heapq.nlargest(max_tickers, _scored())
+    return [row[3] for row in top]
+
+
+def _cache_universe(cache_key: Tuple, tickers: Tuple[str, ...]) -> None:
+    global _UNIVERSE_CACHE
+    with _UNIVERSE_CACHE_LOCK:
+        _UNIVERSE_CACHE = (time.monotonic(), cache_key, tickers)
+
+
+def resolve_universe(cfg: Dict, *, max_tickers: int = 500) -> Tuple[str, ...]:
     """
     Resolve the ticker universe for live scanning.
 
@@ -117,6 +247,11 @@ def resolve_universe(cfg: Dict, *, max_tickers: int = 500) -> List[str]:
       1) Dynamic top-volume universe from provider.
       2) Config-provided fallback universe.
       3) Built-in DEFAULT_FALLBACK.
+
+    Returns an immutable tuple that may be shared between callers; convert
+    with ``list()`` before mutating. A successful dynamic result is reused for
+    ``universe.cache_ttl_seconds`` (default 60; 0 disables) -- see
+    :func:`clear_universe_cache`.
     """
 
     uni_cfg = cfg.get("universe") or {}
@@ -135,17 +270,37 @@ def resolve_universe(cfg: Dict, *, max_tickers: int = 500) -> List[str]:
         )
         max_tickers_cfg = max_tickers
 
-    api_keys = (cfg.get("api_keys") if isinstance(cfg, dict) else None) or load_api_keys()
+    api_keys = (cfg.get("api_keys") if isinstance(cfg, dict) else None) or _cached_api_keys()
     api_key = api_keys.get("polygon_massive") if api_keys else None
 
+    try:
+        cache_ttl = float(uni_cfg.get("cache_ttl_seconds", DEFAULT_CACHE_TTL_SECONDS))
+    except (TypeError, ValueError):
+        cache_ttl = DEFAULT_CACHE_TTL_SECONDS
+    provider_cfg = cfg.get("provider") or {}
+    cache_key = (
+        max_tickers_cfg,
+        provider_cfg.get("base_url"),
+        provider_cfg.get("equity_snapshot_path"),
+        bool(provider_cfg.get("trust_server_sort")),
+    )
+
     # 1) Dynamic universe first
-    dynamic: List[str] = []
+    dynamic: Tuple[str, ...] = ()
     if api_key:
+        with _UNIVERSE_CACHE_LOCK:
+            cached = _UNIVERSE_CACHE
+        if cached is not None and cached[1] == cache_key and time.monotonic() - cached[0] < cache_ttl:
+            LOGGER.debug("[UNIVERSE] Reusing cached dynamic universe | Count: %d", len(cached[2]))
+            return cached[2]
+        # Fetch outside the lock so a slow provider never blocks other callers.
         try:
-            dynamic = _try_fetch_top_volume(cfg, max_tickers_cfg, api_key)
-            dynamic = _unique([t.upper() for t in dynamic])
+            fetched = _try_fetch_top_volume(cfg, max_tickers_cfg, api_key)
+            dynamic = tuple(_unique(fetched)[:max_tickers_cfg])
         except Exception:
             LOGGER.exception("[UNIVERSE] Error fetching dynamic top-volume universe")
+        if dynamic and cache_ttl > 0:
+            _cache_universe(cache_key, dynamic)
     else:
         LOGGER.warning(
             "[UNIVERSE] No API key available for dynamic universe; attempting fallback.",
@@ -156,23 +311,26 @@ def resolve_universe(cfg: Dict, *, max_tickers: int = 500) -> List[str]:
             "[UNIVERSE] Using dynamic top-volume universe | Count: %d",
             len(dynamic),
         )
-        LOGGER.info("[UNIVERSE] Sample: %s", ", ".join(dynamic[:20]))
-        return dynamic[:max_tickers_cfg]
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info("[UNIVERSE] Sample: %s", ", ".join(dynamic[:20]))
+        return dynamic
 
     # 2) Config fallback
     if fallback_from_cfg:
-        deduped = _unique([t.upper() for t in fallback_from_cfg])
+        deduped = _unique(map(str.upper, fallback_from_cfg))
         LOGGER.warning(
             "[UNIVERSE] Dynamic universe empty; using config fallback | Count: %d",
             len(deduped),
         )
-        LOGGER.info("[UNIVERSE] Fallback sample: %s", ", ".join(deduped[:20]))
-        return deduped[:max_tickers_cfg]
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info("[UNIVERSE] Fallback sample: %s", ", ".join(deduped[:20]))
+        return tuple(deduped[:max_tickers_cfg])
 
     # 3) Built-in fallback
     LOGGER.error(
         "[UNIVERSE] Dynamic universe and config fallback empty; using built-in fallback universe",
     )
-    LOGGER.info("[UNIVERSE] Built-in sample: %s", ", ".join(DEFAULT_FALLBACK[:20]))
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info("[UNIVERSE] Built-in sample: %s", ", ".join(DEFAULT_FALLBACK[:20]))
     return DEFAULT_FALLBACK[:max_tickers_cfg]
 